@@ -1,9 +1,22 @@
 # backend/api/routes.py
-from flask import Blueprint, request, jsonify
-from tasks import generate_script_task  # Import our Celery task
+import orjson
+import time
+from flask import Blueprint, Response, request, jsonify, stream_with_context
+from tasks import generate_script_task, redis_client, task_channel  # Import our Celery task
 
 api = Blueprint('api', __name__)
 
+# Task states after which no further updates are published
+TERMINAL_STATES = ('SUCCESS', 'FAILURE', 'REVOKED')
+
+# Seconds without an update before the status stream re-checks the task and
+# sends a keepalive comment
+SSE_KEEPALIVE_INTERVAL = 15
+
+# Longest a status stream stays open, so a task whose worker died cannot hold
+# the connection forever; EventSource clients reconnect or fall back to polling
+SSE_MAX_DURATION = 30 * 60
+
 @api.route('/generate-script', methods=['POST'])
 def generate_script():
     """
@@ -26,23 +39,79 @@ def generate_script():
     # Return the task ID to the client
     return jsonify({'task_id': task.id}), 202 # 202 Accepted
 
+def get_task_status(task_id):
+    """Build the status payload for a background task."""
+    task = generate_script_task.AsyncResult(task_id)
+    # Fetch the task meta once; task.state, task.info and task.result would
+    # each go back to the result backend while the task is still running
+    meta = task._get_task_meta()
+    state, info = meta['status'], meta['result']
+    print(f"Task state {state}")
+    # If the task is successful, the result from the task is in meta['result']
+    if state == 'SUCCESS':
+        return {'state': state, 'result': info}
+    elif state == 'FAILURE':
+        return {
+            'state': state,
+            'status': str(info.get('message')) if isinstance(info, dict) else str(info),
+        }
+    elif isinstance(info, dict):
+        payload = {'state': state, 'status': info.get('status', '')}
+        # Script text generated so far, while Gemini is still streaming
+        if 'partial' in info:
+            payload['partial'] = info['partial']
+        return payload
+    else:
+        return {'state': state, 'status': ''}
+
 @api.route('/status/<task_id>', methods=['GET'])
 def task_status(task_id):
     """
     Checks the status of a background task.
     The client polls this endpoint with the task ID.
     """
-    task = generate_script_task.AsyncResult(task_id)
-    print(f"Task state {task.state}")
-    # If the task is successful, the result from the task is in task.result
-    if task.state == 'SUCCESS':
-         return jsonify({'state': task.state, 'result': task.result})
-    elif task.state == 'FAILURE':
-        response = {
-            'state': task.state,
-            'status': str(task.info.get('message')) if isinstance(task.info, dict) else str(task.info),
-        }
-    else:
-        response = {'state': task.state, 'status': task.info.get('status', '') if task.info else ''}
+    return jsonify(get_task_status(task_id))
+
+@api.route('/status/<task_id>/stream', methods=['GET'])
+def task_status_stream(task_id):
+    """
+    Streams status updates for a background task as Server-Sent Events.
+    Clients subscribe with EventSource instead of polling /status/<task_id>;
+    each event carries the same payload as the polling endpoint.
+    """
+    def events():
+        pubsub = redis_client.pubsub()
+        # Subscribe before reading the current state so no update is missed in between
+        pubsub.subscribe(task_channel(task_id))
+        try:
+            current = get_task_status(task_id)
+            yield f"data: {orjson.dumps(current).decode()}\n\n"
+            if current['state'] in TERMINAL_STATES:
+                return
+
+            deadline = time.monotonic() + SSE_MAX_DURATION
+            while time.monotonic() < deadline:
+                message = pubsub.get_message(ignore_subscribe_messages=True, timeout=SSE_KEEPALIVE_INTERVAL)
+                if message is None:
+                    # Nothing published for a while. Re-read the result backend in case the
+                    # final event went out before the subscription was live, or the task was
+                    # revoked, and keep the connection (and any proxy in between) alive.
+                    current = get_task_status(task_id)
+                    if current['state'] in TERMINAL_STATES:
+                        yield f"data: {orjson.dumps(current).decode()}\n\n"
+                        return
+                    yield ": keepalive\n\n"
+                    continue
+
+                data = message['data'].decode('utf-8')
+                yield f"data: {data}\n\n"
+                if orjson.loads(data).get('state') in TERMINAL_STATES:
+                    return
+        finally:
+            pubsub.close()
 
-    return jsonify(response)
\ No newline at end of file
+    return Response(
+        stream_with_context(events()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+    )
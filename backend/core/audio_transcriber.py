@@ -9,41 +9,176 @@ transcribing audio files using OpenAI Whisper with parallel processing support.
 """
 
 import os
+import bisect
 import logging
+import threading
+import urllib.request
 import multiprocessing as mp
-from typing import Optional, List, Dict
+from multiprocessing import shared_memory
+from pathlib import Path
+from typing import Optional, List, Dict, Union
 from functools import partial
+from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
+import torch
 import whisper
 
 # Import the custom exception from the downloader module
 from .tiktok_downloader import TikTokTranscriberError
 
+# Available Whisper models, with a set for constant-time validation
+AVAILABLE_MODELS = ("tiny", "base", "small", "medium", "large", "large-v1", "large-v2", "large-v3",
+                    "large-v3-turbo", "distil-large-v3")
+_VALID_MODELS = frozenset(AVAILABLE_MODELS)
+
+# Downloaded weights, compiled torch.compile kernels and OpenVINO blobs are
+# kept here, so later runs start warm instead of rebuilding them
+DEFAULT_CACHE_DIR = os.path.expanduser("~/.cache/scripttok/whisper")
+
+# Compiled TensorRT engines are cached in this subdirectory of the cache
+# directory, so the expensive build only runs once
+WHISPER_TRT_CACHE_SUBDIR = "whisper_trt"
+# whisper_trt only ships English-only builds of the smaller models
+_TRT_MODEL_NAMES = {"tiny": "tiny.en", "base": "base.en", "small": "small.en"}
+
+# ONNX Runtime and OpenVINO exports of the Hugging Face Whisper checkpoints are
+# cached in this subdirectory, so the export only runs the first time a worker loads a model
+OPTIMUM_CACHE_SUBDIR = "optimum"
+_HF_MODEL_IDS = {"large-v1": "openai/whisper-large", "distil-large-v3": "distil-whisper/distil-large-v3"}
+
+# Quantized GGML weights for the whisper.cpp backend, downloaded on first use
+# into this subdirectory
+WHISPER_CPP_CACHE_SUBDIR = "whisper_cpp"
+WHISPER_CPP_MODEL_URL = "https://huggingface.co/ggerganov/whisper.cpp/resolve/main/{filename}"
+_GGML_MODEL_FILES = {
+    "tiny": "ggml-tiny-q5_1.bin",
+    "base": "ggml-base-q5_1.bin",
+    "small": "ggml-small-q5_1.bin",
+    "medium": "ggml-medium-q5_0.bin",
+    "large": "ggml-large-v3-q5_0.bin",
+    "large-v1": "ggml-large-v1.bin",
+    "large-v2": "ggml-large-v2-q5_0.bin",
+    "large-v3": "ggml-large-v3-q5_0.bin",
+    "large-v3-turbo": "ggml-large-v3-turbo-q5_0.bin",
+}
+
+# Loaded models shared by every AudioTranscriber in this process, keyed by
+# (model_name, device, backend, quantize, compile_model, compute_type, dtype, attn_impl) and storing (model, resolved_backend)
+_MODEL_CACHE: Dict[tuple, tuple] = {}
+
+# openai-whisper installs KV-cache hooks on the model while decoding (and the
+# transformers backend decodes into a shared static cache), so threads sharing
+# a cached model must not run inference on it at the same time
+_WHISPER_INFERENCE_LOCK = threading.Lock()
+
+# Concurrent transcriptions a GPU faster-whisper model accepts; CTranslate2
+# keeps one model replica per worker on the device and runs them in parallel
+FASTER_WHISPER_GPU_WORKERS = 4
+
+# Backends whose inference is serialized by _WHISPER_INFERENCE_LOCK
+_LOCKED_BACKENDS = frozenset({"whisper", "whisper_trt", "transformers"})
+
+# Silero VAD model and its get_speech_timestamps helper, loaded once per process
+_VAD_MODEL = None
+_VAD_LOCK = threading.Lock()
+
+# Backends whose transcription is preceded by our own silence removal
+# (faster-whisper applies Silero VAD itself through vad_filter)
+_VAD_BACKENDS = frozenset({"whisper", "whisper_cpp", "onnx", "openvino", "transformers"})
+
+# Backends whose model is a Hugging Face speech-recognition pipeline
+_HF_PIPELINE_BACKENDS = frozenset({"onnx", "openvino", "transformers"})
+
+# Transcriber owned by each process of the persistent transcription pool, or
+# the error that kept it from loading
+_WORKER_MODEL = None
+_WORKER_INIT_ERROR: Optional[str] = None
+
+# Downloader owned by each process of a URL download pool
+_WORKER_DOWNLOADER = None
+
+
+def _init_worker(config: dict) -> None:
+    """
+    Pool initializer that builds an AudioTranscriber with the parent's
+    configuration once per worker process, so every file handled by that
+    worker reuses its model.
+    
+    A load failure is recorded instead of raised: mp.Pool replaces workers
+    whose initializer raises, so a bad configuration would otherwise respawn
+    workers forever.
+    """
+    global _WORKER_MODEL, _WORKER_INIT_ERROR
+    try:
+        _WORKER_MODEL = AudioTranscriber(**config)
+    except TikTokTranscriberError as e:
+        _WORKER_INIT_ERROR = str(e)
+
+
+def _available_cpus() -> int:
+    """Return the number of CPUs this process may run on, respecting any affinity pinning."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def load_audio(audio_path: Union[str, np.ndarray]) -> np.ndarray:
+    """
+    Decode an audio file into a 16 kHz mono float32 array.
+    
+    Reads the file in-process with soundfile when possible, avoiding the
+    ffmpeg subprocess whisper.load_audio spawns for every file, and falls
+    back to whisper.load_audio for formats soundfile cannot read.
+    Arrays that are already decoded are returned as float32 unchanged.
+    """
+    if isinstance(audio_path, np.ndarray):
+        return audio_path.astype(np.float32, copy=False)
+    
+    try:
+        import soundfile as sf
+    except ImportError:
+        return whisper.load_audio(audio_path)
+    
+    # Opening the file ourselves raises FileNotFoundError for missing files
+    with open(audio_path, 'rb') as f:
+        try:
+            data, sample_rate = sf.read(f, dtype="float32", always_2d=True)
+        except RuntimeError:
+            return whisper.load_audio(audio_path)
+    
+    audio = data.mean(axis=1)
+    if sample_rate != whisper.audio.SAMPLE_RATE:
+        import torchaudio
+        audio = torchaudio.functional.resample(
+            torch.from_numpy(audio), sample_rate, whisper.audio.SAMPLE_RATE
+        ).numpy()
+    
+    return np.ascontiguousarray(audio, dtype=np.float32)
+
 
 def transcribe_worker(args):
     """
     Worker function for parallel transcription.
-    This runs in a separate process to avoid model sharing issues.
+    This runs in a pool process whose model was loaded by _init_worker.
+    Audio decoded by the parent is read from shared memory when available.
     """
-    audio_path, model_name, language, device, task, transcribe_options = args
+    audio_path, shm_name, n_samples, language, task, transcribe_options = args
     
     try:
-        # Load model in worker process
-        model = whisper.load_model(model_name, device=device)
-        
-        # Prepare transcription options
-        options = {
-            'language': language,
-            'task': task,
-            'verbose': False,
-            **transcribe_options
-        }
+        audio = audio_path
+        if shm_name is not None:
+            shm = shared_memory.SharedMemory(name=shm_name)
+            try:
+                audio = np.frombuffer(shm.buf, dtype=np.float32, count=n_samples).copy()
+            finally:
+                shm.close()
         
-        # Remove None values
-        options = {k: v for k, v in options.items() if v is not None}
+        if _WORKER_MODEL is None:
+            raise TikTokTranscriberError(f"Worker model failed to load: {_WORKER_INIT_ERROR}")
         
         # Transcribe
-        result = model.transcribe(audio_path, **options)
+        result = _WORKER_MODEL.transcribe(audio, language=language, task=task, **transcribe_options)
         
         return {
             'audio_path': audio_path,
@@ -60,19 +195,25 @@ def transcribe_worker(args):
         }
 
 
+def _init_downloader(downloader_class, downloader_kwargs: dict) -> None:
+    """
+    Pool initializer that creates one downloader per worker process, so its
+    yt-dlp instance and HTTP connections are reused across URLs.
+    """
+    global _WORKER_DOWNLOADER
+    _WORKER_DOWNLOADER = downloader_class(**downloader_kwargs)
+
+
 def process_url_worker(args):
     """
     Worker function for parallel URL processing.
-    Downloads audio and prepares it for transcription.
+    Downloads audio with the downloader created by _init_downloader.
     """
-    url, output_dir, filename, downloader_class, downloader_kwargs, index = args
+    url, output_dir, filename, index = args
     
     try:
-        # Create downloader instance in worker process
-        downloader = downloader_class(**downloader_kwargs)
-        
         # Download audio
-        audio_path = downloader.download_audio(
+        audio_path = _WORKER_DOWNLOADER.download_audio(
             url, output_dir=output_dir, filename=filename
         )
         
@@ -97,7 +238,10 @@ class AudioTranscriber:
     """Class responsible for transcribing audio files using OpenAI Whisper with parallel processing."""
     
     def __init__(self, model_name: str = "tiny", device: Optional[str] = None,
-                 logger: Optional[logging.Logger] = None):
+                 logger: Optional[logging.Logger] = None, backend: str = "faster_whisper",
+                 quantize: bool = True, compile_model: bool = True, vad: bool = True,
+                 compute_type: Optional[str] = None, cache_dir: str = DEFAULT_CACHE_DIR,
+                 dtype: str = "float16", attn_impl: str = "flash_attention_2"):
         """
         Initialize the audio transcriber.
         
@@ -105,14 +249,44 @@ class AudioTranscriber:
             model_name: The Whisper model to use (tiny, base, small, medium, large)
             device: Device to run model on (auto-detected if None)
             logger: Logger instance (creates new one if None)
+            backend: Inference backend ("whisper", "whisper_trt", "faster_whisper", "whisper_cpp",
+                "onnx", "openvino" or "transformers")
+            quantize: Apply dynamic INT8 quantization when running Whisper on CPU
+            compile_model: Compile the Whisper encoder with torch.compile on GPU
+            vad: Drop non-speech regions with Silero VAD before transcribing
+            compute_type: CTranslate2 compute type for faster-whisper (e.g. "int8",
+                "int8_float16", "float16"); int8 on CPU and float16 on GPU if None
+            cache_dir: Directory for model weights and compiled-kernel caches
+            dtype: Weight dtype for the transformers backend on GPU ("float16" or "bfloat16")
+            attn_impl: Attention implementation for the transformers backend
+                ("flash_attention_2" falls back to "sdpa" if flash-attn is missing)
         """
         self.model_name = model_name
         self.device = device
+        self.backend = backend
+        self.quantize = quantize
+        self.compile_model = compile_model
+        self.compute_type = compute_type
+        self.cache_dir = cache_dir
+        self.dtype = dtype
+        self.attn_impl = attn_impl
         self.logger = logger or self._setup_logger()
         
         # Initialize Whisper model for single file processing
         self.model = None
         self._load_model()
+        
+        # faster-whisper filters with its own built-in Silero VAD; the other
+        # backends get silence removed by _remove_silence before transcribing
+        self.vad_filter = vad and self.backend == "faster_whisper"
+        self.vad = vad and self.backend in _VAD_BACKENDS and self._load_vad() is not None
+        
+        # faster-whisper batched pipeline wrapping self.model, created on first use
+        self._batched_model = None
+        
+        # Persistent worker pool for parallel transcription, created on first use
+        self._pool = None
+        self._pool_size = 0
     
     def _setup_logger(self) -> logging.Logger:
         """Set up logging configuration."""
@@ -134,12 +308,54 @@ class AudioTranscriber:
         try:
             self.logger.info(f"Loading OpenAI Whisper model: {self.model_name}")
             
-            # Available models
-            valid_models = ["tiny", "base", "small", "medium", "large", "large-v1", "large-v2", "large-v3"]
-            if self.model_name not in valid_models:
-                raise TikTokTranscriberError(f"Invalid model name. Choose from: {valid_models}")
+            if self.model_name not in _VALID_MODELS:
+                raise TikTokTranscriberError(f"Invalid model name. Choose from: {list(AVAILABLE_MODELS)}")
+            
+            cache_key = (self.model_name, self.device, self.backend, self.quantize, self.compile_model,
+                         self.compute_type, self.dtype, self.attn_impl)
+            if cache_key in _MODEL_CACHE:
+                self.model, self.backend = _MODEL_CACHE[cache_key]
+                self.logger.info("Reusing already loaded model")
+                return
+            
+            if self.backend == "whisper_trt":
+                self.model = self._load_whisper_trt_model()
+                if self.model is None:
+                    self.backend = "whisper"
+            elif self.backend == "faster_whisper":
+                self.model = self._load_faster_whisper_model()
+                if self.model is None:
+                    self.backend = "whisper"
+            elif self.backend == "whisper_cpp":
+                self.model = self._load_whisper_cpp_model()
+                if self.model is None:
+                    self.backend = "whisper"
+            elif self.backend in ("onnx", "openvino"):
+                self.model = self._load_optimum_model()
+                if self.model is None:
+                    self.backend = "whisper"
+            elif self.backend == "transformers":
+                self.model = self._load_transformers_model()
+                if self.model is None:
+                    self.backend = "whisper"
+            
+            if self.model is None:
+                # distil-large-v3 has no openai-whisper checkpoint, so say which backends have it
+                # rather than letting whisper.load_model fail with a bare "not found"
+                if self.model_name not in whisper.available_models():
+                    raise TikTokTranscriberError(
+                        f"'{self.model_name}' is not available with openai-whisper; use the "
+                        f"faster_whisper, onnx, openvino or transformers backend (with its package installed)"
+                    )
+                self.model = whisper.load_model(self.model_name, device=self.device, download_root=self.cache_dir)
+                if self.quantize and self.model.device.type == "cpu":
+                    self._quantize_for_cpu()
+                elif self.model.device.type == "cuda":
+                    self._convert_to_fp16()
+                    if self.compile_model and hasattr(torch, "compile"):
+                        self._compile_encoder()
             
-            self.model = whisper.load_model(self.model_name, device=self.device)
+            _MODEL_CACHE[cache_key] = (self.model, self.backend)
             self.logger.info(f"Model loaded successfully")
             
         except Exception as e:
@@ -148,17 +364,459 @@ class AudioTranscriber:
                 error_msg += "\n\nTry using a smaller model: tiny, base, or small"
             raise TikTokTranscriberError(error_msg)
     
-    def get_available_models(self) -> list:
-        """Get list of available Whisper models."""
-        return ["tiny", "base", "small", "medium", "large", "large-v1", "large-v2", "large-v3"]
+    def _load_vad(self):
+        """
+        Load the Silero VAD model, once per process.
+        
+        Returns:
+            (model, get_speech_timestamps), or None if it could not be loaded
+        """
+        global _VAD_MODEL
+        with _VAD_LOCK:
+            if _VAD_MODEL is None:
+                try:
+                    model, utils = torch.hub.load('snakers4/silero-vad', 'silero_vad', trust_repo=True)
+                    _VAD_MODEL = (model, utils[0])
+                except Exception as e:
+                    self.logger.warning(f"Silero VAD is not available ({e}), transcribing full audio")
+                    return None
+        return _VAD_MODEL
+    
+    def _remove_silence(self, audio: np.ndarray) -> tuple:
+        """
+        Concatenate only the speech regions of a waveform.
+        
+        Args:
+            audio: 16 kHz mono float32 waveform
+            
+        Returns:
+            (speech_audio, offsets), where offsets is a list of
+            (start in speech_audio, start in audio) pairs in seconds, one per
+            kept region. The full waveform is returned if no speech is found.
+        """
+        model, get_speech_timestamps = _VAD_MODEL
+        with _VAD_LOCK:
+            timestamps = get_speech_timestamps(
+                torch.from_numpy(audio), model, sampling_rate=whisper.audio.SAMPLE_RATE
+            )
+        
+        if not timestamps:
+            return audio, [(0.0, 0.0)]
+        
+        offsets = []
+        kept = 0
+        for ts in timestamps:
+            offsets.append((kept / whisper.audio.SAMPLE_RATE, ts['start'] / whisper.audio.SAMPLE_RATE))
+            kept += ts['end'] - ts['start']
+        
+        speech = np.concatenate([audio[ts['start']:ts['end']] for ts in timestamps])
+        self.logger.info(f"VAD kept {len(speech) / len(audio):.0%} of the audio")
+        return speech, offsets
+    
+    @staticmethod
+    def _restore_timestamps(result: dict, offsets: list) -> dict:
+        """Map segment times on the speech-only timeline back onto the original audio."""
+        starts = [speech_start for speech_start, _ in offsets]
+        
+        def restore(t):
+            speech_start, original_start = offsets[max(bisect.bisect_right(starts, t) - 1, 0)]
+            return original_start + (t - speech_start)
+        
+        for segment in result.get('segments', []):
+            segment['start'] = restore(segment['start'])
+            segment['end'] = restore(segment['end'])
+            for word in segment.get('words') or []:
+                word['start'] = restore(word['start'])
+                word['end'] = restore(word['end'])
+        return result
+    
+    def _quantize_for_cpu(self) -> None:
+        """Apply dynamic INT8 quantization to the model's Linear layers."""
+        self.logger.info("Applying dynamic INT8 quantization for CPU inference")
+        
+        # Whisper subclasses nn.Linear only to cast weights to the input dtype,
+        # which is a no-op for FP32 on CPU. Dynamic quantization matches exact
+        # module types, so unwrap them to plain nn.Linear first.
+        for module in self.model.modules():
+            if isinstance(module, torch.nn.Linear) and type(module) is not torch.nn.Linear:
+                module.__class__ = torch.nn.Linear
+        
+        if "fbgemm" in torch.backends.quantized.supported_engines:
+            torch.backends.quantized.engine = "fbgemm"
+        torch.set_num_threads(_available_cpus())
+        
+        self.model = torch.quantization.quantize_dynamic(
+            self.model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+    
+    def _convert_to_fp16(self) -> None:
+        """Store the model weights in FP16 so they are not cast on every forward pass."""
+        self.model.half()
+        # Whisper's LayerNorm always computes in FP32, so keep its parameters there
+        for module in self.model.modules():
+            if isinstance(module, torch.nn.LayerNorm):
+                module.float()
+    
+    def _compile_encoder(self) -> None:
+        """
+        Compile the audio encoder with torch.compile and warm it up.
+        
+        Only the encoder is compiled: its input is always a fixed 30 s mel
+        window, whereas the decoder runs on a growing token sequence with
+        KV-cache hooks and would recompile at every step.
+        """
+        self.logger.info("Compiling Whisper encoder with torch.compile")
+        # Reuse Inductor's compiled kernels from earlier runs
+        os.environ.setdefault("TORCHINDUCTOR_CACHE_DIR", os.path.join(self.cache_dir, "inductor"))
+        self.model.encoder = torch.compile(self.model.encoder, mode="reduce-overhead", fullgraph=False)
+        
+        # Warm up with a silent window so the first transcription doesn't pay the compile cost
+        dummy_mel = torch.zeros(
+            1, self.model.dims.n_mels, whisper.audio.N_FRAMES,
+            device=self.model.device, dtype=torch.float16
+        )
+        with torch.no_grad():
+            self.model.encoder(dummy_mel)
+    
+    def _load_whisper_trt_model(self):
+        """
+        Load a TensorRT-compiled Whisper model, building the engine on first use.
+        
+        Returns:
+            The WhisperTRT model, or None if TensorRT/CUDA is unavailable
+            
+        Raises:
+            TikTokTranscriberError: If whisper_trt has no build of the model
+        """
+        trt_model_name = _TRT_MODEL_NAMES.get(self.model_name)
+        if trt_model_name is None:
+            raise TikTokTranscriberError(
+                f"The whisper_trt backend only supports {', '.join(_TRT_MODEL_NAMES)}, not '{self.model_name}'"
+            )
+        
+        try:
+            from whisper_trt import load_trt_model
+        except ImportError as e:
+            self.logger.warning(f"whisper_trt is not available ({e}), falling back to openai-whisper")
+            return None
+        
+        engine_dir = os.path.join(self.cache_dir, WHISPER_TRT_CACHE_SUBDIR)
+        Path(engine_dir).mkdir(parents=True, exist_ok=True)
+        engine_path = os.path.join(engine_dir, f"{trt_model_name}.pth")
+        
+        try:
+            if not os.path.exists(engine_path):
+                self.logger.info(f"Building TensorRT engine for '{trt_model_name}' (one-time cost)")
+            return load_trt_model(trt_model_name, path=engine_path)
+        except Exception as e:
+            self.logger.warning(f"Failed to load WhisperTRT model ({e}), falling back to openai-whisper")
+            return None
+    
+    def _transcribe_whisper_trt(self, audio_path: Union[str, np.ndarray], options: dict) -> dict:
+        """
+        Transcribe with WhisperTRT and reshape the output into the openai-whisper
+        result schema (text, segments, language).
+        
+        WhisperTRT.transcribe takes only the audio and decodes a single 30 s
+        window, so longer audio is transcribed window by window, one segment each.
+        """
+        if options.get('task') == "translate" or options.get('language') not in (None, "en"):
+            raise TikTokTranscriberError("The whisper_trt backend only transcribes English")
+        
+        audio = load_audio(audio_path)
+        segment_dicts = []
+        for start in range(0, max(len(audio), 1), whisper.audio.N_SAMPLES):
+            window = audio[start:start + whisper.audio.N_SAMPLES]
+            # The TensorRT execution context is not safe to share between threads
+            with _WHISPER_INFERENCE_LOCK:
+                text = self.model.transcribe(window)['text']
+            segment_dicts.append({
+                'id': len(segment_dicts),
+                'start': start / whisper.audio.SAMPLE_RATE,
+                'end': (start + len(window)) / whisper.audio.SAMPLE_RATE,
+                'text': text,
+            })
+        
+        return {
+            'text': "".join(seg['text'] for seg in segment_dicts),
+            'segments': segment_dicts,
+            'language': "en",
+        }
+    
+    def _load_faster_whisper_model(self):
+        """
+        Load a CTranslate2 faster-whisper model, with INT8 weights on CPU and
+        FP16 on GPU unless a compute_type was given.
+        
+        Returns:
+            The faster-whisper model, or None if faster-whisper is not installed
+        """
+        try:
+            from faster_whisper import WhisperModel
+        except ImportError as e:
+            self.logger.warning(f"faster_whisper is not available ({e}), falling back to openai-whisper")
+            return None
+        
+        device = self._resolved_device()
+        compute_type = self.compute_type or ("int8" if device == "cpu" else "float16")
+        # On CPU use every core this process may run on (a pinned worker's share);
+        # on GPU accept several concurrent transcribe() calls from threads
+        cpu_threads = _available_cpus() if device == "cpu" else 0
+        num_workers = 1 if device == "cpu" else FASTER_WHISPER_GPU_WORKERS
+        return WhisperModel(self.model_name, device=device, compute_type=compute_type,
+                            cpu_threads=cpu_threads, num_workers=num_workers,
+                            download_root=self.cache_dir)
+    
+    def _transcribe_faster_whisper(self, audio_path: Union[str, np.ndarray], options: dict,
+                                   model=None) -> dict:
+        """
+        Transcribe with faster-whisper and reshape the output into the
+        openai-whisper result schema (text, segments, language).
+        
+        Args:
+            audio_path: Path to the audio file, or a 16 kHz mono float32 waveform
+            options: faster-whisper transcribe() options
+            model: WhisperModel or BatchedInferencePipeline to use (the loaded model if None)
+        """
+        options.pop('verbose', None)
+        # Skip non-speech regions with faster-whisper's built-in Silero VAD
+        options.setdefault('vad_filter', self.vad_filter)
+        # Greedy decoding; beam search costs several decoder passes per token
+        options.setdefault('beam_size', 1)
+        segments, info = (model or self.model).transcribe(load_audio(audio_path), **options)
+        
+        # faster-whisper yields segments lazily; decoding happens while iterating
+        segment_dicts = [
+            {
+                'id': seg.id,
+                'start': seg.start,
+                'end': seg.end,
+                'text': seg.text,
+                'avg_logprob': seg.avg_logprob,
+                'no_speech_prob': seg.no_speech_prob,
+            }
+            for seg in segments
+        ]
+        
+        return {
+            'text': "".join(seg['text'] for seg in segment_dicts),
+            'segments': segment_dicts,
+            'language': info.language,
+        }
+    
+    def _load_optimum_model(self):
+        """
+        Load Whisper through Hugging Face Optimum on ONNX Runtime (CPU) or
+        OpenVINO (INT8 weights), exporting and caching the model on first use.
+        
+        Returns:
+            A transformers speech-recognition pipeline, or None if Optimum is not installed
+        """
+        try:
+            from transformers import AutoProcessor, pipeline
+            if self.backend == "onnx":
+                from optimum.onnxruntime import ORTModelForSpeechSeq2Seq as OptimumModel
+                load_kwargs = {'provider': "CPUExecutionProvider"}
+                export_kwargs = load_kwargs
+            else:
+                from optimum.intel import OVModelForSpeechSeq2Seq as OptimumModel
+                # Cache compiled OpenVINO blobs so later loads skip compilation
+                load_kwargs = {'ov_config': {'CACHE_DIR': os.path.join(self.cache_dir, "openvino")}}
+                export_kwargs = {**load_kwargs, 'load_in_8bit': True}
+        except ImportError as e:
+            self.logger.warning(f"Optimum {self.backend} support is not available ({e}), falling back to openai-whisper")
+            return None
+        
+        export_dir = os.path.join(self.cache_dir, OPTIMUM_CACHE_SUBDIR, self.backend, self.model_name)
+        if os.path.isdir(export_dir):
+            model = OptimumModel.from_pretrained(export_dir, **load_kwargs)
+            processor = AutoProcessor.from_pretrained(export_dir)
+        else:
+            model_id = _HF_MODEL_IDS.get(self.model_name, f"openai/whisper-{self.model_name}")
+            self.logger.info(f"Exporting {model_id} for {self.backend} (first use only)")
+            model = OptimumModel.from_pretrained(model_id, export=True, cache_dir=self.cache_dir, **export_kwargs)
+            processor = AutoProcessor.from_pretrained(model_id, cache_dir=self.cache_dir)
+            
+            # Save under a temporary name so an interrupted export is never reused
+            partial_dir = f"{export_dir}.part"
+            model.save_pretrained(partial_dir)
+            processor.save_pretrained(partial_dir)
+            os.replace(partial_dir, export_dir)
+        
+        return pipeline(
+            "automatic-speech-recognition",
+            model=model,
+            tokenizer=processor.tokenizer,
+            feature_extractor=processor.feature_extractor,
+            chunk_length_s=30,
+        )
+    
+    def _load_transformers_model(self):
+        """
+        Load the Hugging Face Whisper model with transformers.
+        
+        On GPU the weights are loaded in self.dtype with self.attn_impl
+        attention (FlashAttention-2 by default, SDPA if flash-attn is not
+        installed); CPU runs keep FP32 and SDPA. On GPU the decoder uses a static KV cache and the model's forward pass
+        is compiled with torch.compile, then warmed up on a silent window so the
+        first transcription doesn't pay the compile cost.
+        
+        Returns:
+            A transformers speech-recognition pipeline, or None if transformers is not installed
+        """
+        try:
+            from transformers import AutoProcessor, WhisperForConditionalGeneration, pipeline
+        except ImportError as e:
+            self.logger.warning(f"transformers is not available ({e}), falling back to openai-whisper")
+            return None
+        
+        device = self._resolved_device()
+        on_gpu = device.startswith("cuda")
+        torch_dtype = getattr(torch, self.dtype) if on_gpu else torch.float32
+        
+        attn_impl = self.attn_impl if on_gpu else "sdpa"
+        if attn_impl == "flash_attention_2":
+            try:
+                import flash_attn  # noqa: F401
+            except ImportError:
+                self.logger.warning("flash-attn is not installed, using SDPA attention")
+                attn_impl = "sdpa"
+        
+        model_id = _HF_MODEL_IDS.get(self.model_name, f"openai/whisper-{self.model_name}")
+        model = WhisperForConditionalGeneration.from_pretrained(
+            model_id, cache_dir=self.cache_dir, torch_dtype=torch_dtype, attn_implementation=attn_impl
+        ).to(device)
+        processor = AutoProcessor.from_pretrained(model_id, cache_dir=self.cache_dir)
+        
+        asr = pipeline(
+            "automatic-speech-recognition",
+            model=model,
+            tokenizer=processor.tokenizer,
+            feature_extractor=processor.feature_extractor,
+            chunk_length_s=30,
+            device=device,
+            # Casts the input features to the model's dtype before generate()
+            torch_dtype=torch_dtype,
+        )
+        
+        if on_gpu and self.compile_model and hasattr(torch, "compile"):
+            self.logger.info("Compiling Whisper with a static KV cache")
+            os.environ.setdefault("TORCHINDUCTOR_CACHE_DIR", os.path.join(self.cache_dir, "inductor"))
+            model.generation_config.cache_implementation = "static"
+            model.forward = torch.compile(model.forward, mode="reduce-overhead", fullgraph=True)
+            
+            silence = np.zeros(whisper.audio.N_SAMPLES, dtype=np.float32)
+            asr({'raw': silence, 'sampling_rate': whisper.audio.SAMPLE_RATE})
+        
+        return asr
+    
+    def _transcribe_hf_pipeline(self, audio_path: Union[str, np.ndarray], options: dict) -> dict:
+        """
+        Transcribe with a Hugging Face pipeline (transformers, ONNX Runtime or
+        OpenVINO) and reshape the output into the openai-whisper result schema
+        (text, segments, language).
+        """
+        generate_kwargs = {'task': options.get('task', "transcribe")}
+        if options.get('language'):
+            generate_kwargs['language'] = options['language']
+        
+        inputs = {'raw': load_audio(audio_path), 'sampling_rate': whisper.audio.SAMPLE_RATE}
+        if self.backend == "transformers":
+            with _WHISPER_INFERENCE_LOCK:
+                output = self.model(inputs, return_timestamps=True, generate_kwargs=generate_kwargs)
+        else:
+            output = self.model(inputs, return_timestamps=True, generate_kwargs=generate_kwargs)
+        
+        # The final chunk's end time is None when the audio ends mid-segment
+        segment_dicts = []
+        for i, chunk in enumerate(output.get('chunks', [])):
+            start, end = chunk['timestamp']
+            segment_dicts.append({'id': i, 'start': start, 'end': end if end is not None else start,
+                                  'text': chunk['text']})
+        
+        return {
+            'text': output['text'],
+            'segments': segment_dicts,
+            'language': options.get('language'),
+        }
+    
+    def _load_whisper_cpp_model(self):
+        """
+        Load a quantized GGML model with whisper.cpp.
+        
+        Returns:
+            The whisper.cpp model, or None if pywhispercpp is not installed
+        """
+        try:
+            from pywhispercpp.model import Model
+        except ImportError as e:
+            self.logger.warning(f"pywhispercpp is not available ({e}), falling back to openai-whisper")
+            return None
+        
+        if self.model_name not in _GGML_MODEL_FILES:
+            self.logger.warning(f"No GGML weights for {self.model_name}, falling back to openai-whisper")
+            return None
+        
+        model_path = self._download_ggml_model()
+        return Model(model_path, n_threads=_available_cpus(), print_progress=False, print_realtime=False)
+    
+    def _download_ggml_model(self) -> str:
+        """
+        Download the quantized GGML weights for the current model if needed.
+        
+        Returns:
+            Path to the local GGML model file
+        """
+        filename = _GGML_MODEL_FILES[self.model_name]
+        model_dir = os.path.join(self.cache_dir, WHISPER_CPP_CACHE_SUBDIR)
+        model_path = os.path.join(model_dir, filename)
+        if os.path.exists(model_path):
+            return model_path
+        
+        Path(model_dir).mkdir(parents=True, exist_ok=True)
+        url = WHISPER_CPP_MODEL_URL.format(filename=filename)
+        self.logger.info(f"Downloading GGML model: {url}")
+        
+        # Download to a temporary name so an interrupted download is never reused
+        partial_path = f"{model_path}.part"
+        urllib.request.urlretrieve(url, partial_path)
+        os.replace(partial_path, model_path)
+        return model_path
+    
+    def _transcribe_whisper_cpp(self, audio_path: Union[str, np.ndarray], options: dict) -> dict:
+        """
+        Transcribe with whisper.cpp and reshape the output into the
+        openai-whisper result schema (text, segments, language).
+        """
+        params = {'translate': options.get('task') == "translate"}
+        if options.get('language'):
+            params['language'] = options['language']
+        
+        segments = self.model.transcribe(audio_path, **params)
+        
+        # whisper.cpp reports timestamps in centiseconds
+        segment_dicts = [
+            {'id': i, 'start': seg.t0 / 100, 'end': seg.t1 / 100, 'text': seg.text}
+            for i, seg in enumerate(segments)
+        ]
+        
+        return {
+            'text': "".join(seg['text'] for seg in segment_dicts),
+            'segments': segment_dicts,
+            'language': options.get('language'),
+        }
+    
+    def get_available_models(self) -> tuple:
+        """Get the available Whisper models."""
+        return AVAILABLE_MODELS
     
-    def transcribe(self, audio_path: str, language: Optional[str] = None, 
+    def transcribe(self, audio_path: Union[str, np.ndarray], language: Optional[str] = None, 
                    task: str = "transcribe", **kwargs) -> dict:
         """
         Transcribe audio file using the loaded Whisper model.
         
         Args:
-            audio_path: Path to the audio file
+            audio_path: Path to the audio file, or a 16 kHz mono float32 waveform
             language: Language code for transcription (auto-detect if None)
             task: Task type ("transcribe" or "translate")
             **kwargs: Additional arguments for whisper.transcribe()
@@ -169,14 +827,14 @@ class AudioTranscriber:
         Raises:
             TikTokTranscriberError: If transcription fails
         """
-        if not os.path.exists(audio_path):
-            raise TikTokTranscriberError(f"Audio file not found: {audio_path}")
-        
         if self.model is None:
             raise TikTokTranscriberError("Model not loaded. Please initialize the transcriber first.")
         
         try:
-            self.logger.info(f"Transcribing audio: {audio_path}")
+            if isinstance(audio_path, np.ndarray):
+                self.logger.info(f"Transcribing in-memory audio ({len(audio_path) / whisper.audio.SAMPLE_RATE:.1f}s)")
+            else:
+                self.logger.info(f"Transcribing audio: {audio_path}")
             
             # Default transcription options
             transcribe_options = {
@@ -189,49 +847,509 @@ class AudioTranscriber:
             # Remove None values
             transcribe_options = {k: v for k, v in transcribe_options.items() if v is not None}
             
+            if self.backend == "whisper" and self.model.device.type == "cuda":
+                transcribe_options.setdefault('fp16', True)
+            
+            offsets = None
+            if self.vad:
+                audio_path, offsets = self._remove_silence(load_audio(audio_path))
+            
             # Transcribe with Whisper
-            result = self.model.transcribe(audio_path, **transcribe_options)
+            if self.backend == "faster_whisper":
+                result = self._transcribe_faster_whisper(audio_path, transcribe_options)
+            elif self.backend == "whisper_trt":
+                result = self._transcribe_whisper_trt(audio_path, transcribe_options)
+            elif self.backend == "whisper_cpp":
+                result = self._transcribe_whisper_cpp(audio_path, transcribe_options)
+            elif self.backend in _HF_PIPELINE_BACKENDS:
+                result = self._transcribe_hf_pipeline(audio_path, transcribe_options)
+            elif self.backend == "whisper" and self.model.device.type == "cuda":
+                audio = load_audio(audio_path)
+                if len(audio) > whisper.audio.N_SAMPLES and not kwargs:
+                    # Decode the 30 s windows of long clips together instead of one after another
+                    result = self._transcribe_chunks(audio, language, task)
+                else:
+                    audio = self._load_audio_to_device(audio)
+                    with _WHISPER_INFERENCE_LOCK:
+                        result = self.model.transcribe(audio, **transcribe_options)
+            elif self.backend == "whisper":
+                audio = load_audio(audio_path)
+                with _WHISPER_INFERENCE_LOCK:
+                    result = self.model.transcribe(audio, **transcribe_options)
+            else:
+                result = self.model.transcribe(audio_path, **transcribe_options)
+            
+            if offsets is not None:
+                result = self._restore_timestamps(result, offsets)
             
             self.logger.info("Transcription completed successfully")
             return result
             
+        except FileNotFoundError as e:
+            raise TikTokTranscriberError(f"Audio file not found: {audio_path}") from e
         except Exception as e:
             raise TikTokTranscriberError(f"Failed to transcribe audio: {e}")
     
+    def _load_audio_to_device(self, audio_path: Union[str, np.ndarray]) -> torch.Tensor:
+        """
+        Decode audio and move the waveform onto the model's device, so Whisper
+        computes the log-mel spectrogram there instead of on the CPU.
+        """
+        audio = torch.from_numpy(load_audio(audio_path))
+        return audio.pin_memory().to(self.model.device, non_blocking=True)
+    
     def transcribe_multiple_files(self, audio_files: List[str], language: Optional[str] = None,
                                   task: str = "transcribe", num_processes: Optional[int] = None,
-                                  **kwargs) -> List[Dict]:
+                                  num_streams: int = 4, **kwargs) -> List[Dict]:
         """
         Transcribe multiple audio files in parallel.
         
+        On GPU the already loaded model is shared instead of loading one copy
+        per process: openai-whisper batches the files, other backends run
+        them from a thread pool. The process pool is only used on CPU.
+        
         Args:
             audio_files: List of audio file paths
             language: Language code for transcription
             task: Task type ("transcribe" or "translate")
             num_processes: Number of parallel processes (default: CPU count)
+            num_streams: Number of concurrent transcriptions on GPU
             **kwargs: Additional arguments for transcription
             
         Returns:
             List of transcription results
         """
+        if self._on_gpu():
+            if self.backend == "whisper":
+                return self.transcribe_batch(audio_files, language=language, task=task)
+            return self._transcribe_threaded(audio_files, language, task, num_streams, **kwargs)
+        
         if num_processes is None:
             num_processes = min(mp.cpu_count(), len(audio_files))
         
         self.logger.info(f"Starting parallel transcription of {len(audio_files)} files using {num_processes} processes")
         
-        # Prepare arguments for worker processes
-        args = [
-            (audio_path, self.model_name, language, self.device, task, kwargs)
-            for audio_path in audio_files
-        ]
+        # Decode audio once in this process and hand it to the workers through
+        # shared memory, so workers neither re-read the files nor spawn ffmpeg
+        def load(audio_path):
+            try:
+                return load_audio(audio_path)
+            except Exception as e:
+                self.logger.warning(f"Failed to pre-decode {audio_path}, worker will load it: {e}")
+                return None
+        
+        with ThreadPoolExecutor() as executor:
+            audios = list(executor.map(load, audio_files))
         
-        # Process files in parallel
-        with mp.Pool(processes=num_processes) as pool:
-            results = pool.map(transcribe_worker, args)
+        shared_blocks = []
+        try:
+            # Prepare arguments for worker processes
+            args = []
+            for audio_path, audio in zip(audio_files, audios):
+                if audio is None:
+                    args.append((audio_path, None, 0, language, task, kwargs))
+                    continue
+                
+                shm = shared_memory.SharedMemory(create=True, size=max(audio.nbytes, 1))
+                shm.buf[:audio.nbytes] = audio.view(np.uint8)
+                shared_blocks.append(shm)
+                args.append((audio_path, shm.name, len(audio), language, task, kwargs))
+            
+            # Process files in parallel
+            results = self._get_pool(num_processes).map(transcribe_worker, args)
+        finally:
+            for shm in shared_blocks:
+                shm.close()
+                shm.unlink()
         
         self.logger.info("Parallel transcription completed")
         return results
     
+    def _resolved_device(self) -> str:
+        """Return the requested device, or the best available one if none was given."""
+        if self.device:
+            return self.device
+        return "cuda" if torch.cuda.is_available() else "cpu"
+    
+    def concurrency(self) -> int:
+        """
+        Return how many threads can usefully transcribe with this model at once.
+        
+        A GPU faster-whisper model decodes FASTER_WHISPER_GPU_WORKERS calls in
+        parallel. Backends serialized by the inference lock gain from a second
+        thread only, which prepares the next clip while the first decodes.
+        """
+        if self.backend == "faster_whisper" and self._on_gpu():
+            return FASTER_WHISPER_GPU_WORKERS
+        if self.backend in _LOCKED_BACKENDS:
+            return 2
+        return 1
+    
+    def _on_gpu(self) -> bool:
+        """Check whether the loaded model runs on a CUDA device."""
+        if self.backend == "whisper":
+            return self.model.device.type == "cuda"
+        if self.backend in ("whisper_cpp", "onnx", "openvino"):
+            return False
+        return self._resolved_device().startswith("cuda")
+    
+    def _transcribe_threaded(self, audio_files: List[str], language: Optional[str],
+                             task: str, max_workers: int, **kwargs) -> List[Dict]:
+        """Transcribe files concurrently from a thread pool sharing the loaded model."""
+        self.logger.info(f"Starting threaded transcription of {len(audio_files)} files using {max_workers} threads")
+        
+        def run(audio_path):
+            try:
+                result = self.transcribe(audio_path, language=language, task=task, **kwargs)
+                return {'audio_path': audio_path, 'result': result, 'status': 'success'}
+            except TikTokTranscriberError as e:
+                return {'audio_path': audio_path, 'result': None, 'status': 'error', 'error': str(e)}
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(run, audio_files))
+        
+        self.logger.info("Threaded transcription completed")
+        return results
+    
+    def transcribe_batch(self, audio_files: List[Union[str, np.ndarray]], language: Optional[str] = None,
+                         task: str = "transcribe", batch_size: int = 16) -> List[Dict]:
+        """
+        Transcribe multiple audio clips by padding them to one 30 s window and
+        stacking their mel spectrograms into batched forward passes of the
+        loaded model. All clips in a call share the same language.
+        
+        Clips longer than a single 30 s Whisper window are transcribed
+        individually with transcribe(). With the faster-whisper backend each
+        clip is instead split into VAD speech chunks that faster-whisper's
+        BatchedInferencePipeline decodes batch_size at a time; other backends
+        send each clip through transcribe() in turn.
+        
+        Args:
+            audio_files: List of audio file paths or 16 kHz mono float32 waveforms
+            language: Language code for transcription (auto-detect if None)
+            task: Task type ("transcribe" or "translate")
+            batch_size: Maximum number of clips (or faster-whisper chunks) per forward pass
+            
+        Returns:
+            List of transcription results in the same order as audio_files
+        """
+        if self.backend == "faster_whisper":
+            return self._transcribe_batch_faster_whisper(audio_files, language, task, batch_size)
+        # The mel stacking below relies on openai-whisper's model and decode()
+        if self.backend != "whisper":
+            return self._transcribe_each(audio_files, language, task)
+        
+        results: List[Optional[Dict]] = [None] * len(audio_files)
+        
+        def load(audio_path):
+            try:
+                return load_audio(audio_path)
+            except Exception as e:
+                self.logger.warning(f"Failed to load audio {audio_path}: {e}")
+                return None
+        
+        # Decode audio and compute log-mel spectrograms off the main thread
+        with ThreadPoolExecutor() as executor:
+            audios = list(executor.map(load, audio_files))
+            
+            batchable = []
+            for i, (audio_path, audio) in enumerate(zip(audio_files, audios)):
+                if audio is None:
+                    results[i] = {'audio_path': audio_path, 'result': None,
+                                  'status': 'error', 'error': 'Failed to load audio'}
+                elif len(audio) > whisper.audio.N_SAMPLES:
+                    try:
+                        result = self.transcribe(audio, language=language, task=task)
+                        results[i] = {'audio_path': audio_path, 'result': result, 'status': 'success'}
+                    except TikTokTranscriberError as e:
+                        results[i] = {'audio_path': audio_path, 'result': None,
+                                      'status': 'error', 'error': str(e)}
+                else:
+                    batchable.append(i)
+            
+            n_mels = self.model.dims.n_mels
+            mels = dict(zip(batchable, executor.map(
+                lambda i: whisper.log_mel_spectrogram(whisper.pad_or_trim(audios[i]), n_mels=n_mels),
+                batchable
+            )))
+        
+        options = whisper.DecodingOptions(
+            language=language,
+            task=task,
+            without_timestamps=True,
+            fp16=self.model.device.type == "cuda",
+        )
+        
+        for start in range(0, len(batchable), batch_size):
+            indices = batchable[start:start + batch_size]
+            self.logger.info(f"Transcribing batch of {len(indices)} clips")
+            
+            batch = torch.stack([mels[i] for i in indices]).to(self.model.device)
+            with _WHISPER_INFERENCE_LOCK:
+                decoded = whisper.decode(self.model, batch, options)
+            
+            for i, result in zip(indices, decoded):
+                duration = len(audios[i]) / whisper.audio.SAMPLE_RATE
+                results[i] = {
+                    'audio_path': audio_files[i],
+                    'result': {
+                        'text': result.text,
+                        'segments': [{'id': 0, 'start': 0.0, 'end': duration, 'text': result.text}],
+                        'language': result.language,
+                    },
+                    'status': 'success'
+                }
+        
+        self.logger.info("Batched transcription completed")
+        return results
+    
+    def _transcribe_batch_faster_whisper(self, audio_files: List[Union[str, np.ndarray]],
+                                         language: Optional[str], task: str,
+                                         batch_size: int) -> List[Dict]:
+        """Transcribe clips with faster-whisper's batched pipeline, which decodes VAD chunks in batches."""
+        from faster_whisper import BatchedInferencePipeline
+        
+        if self._batched_model is None:
+            self._batched_model = BatchedInferencePipeline(model=self.model)
+        
+        results = []
+        for audio_path in audio_files:
+            try:
+                audio = load_audio(audio_path)
+                options = {'language': language, 'task': task, 'batch_size': batch_size,
+                           # The pipeline needs VAD chunks to split clips longer than one window
+                           'vad_filter': self.vad_filter or len(audio) > whisper.audio.N_SAMPLES}
+                options = {k: v for k, v in options.items() if v is not None}
+                result = self._transcribe_faster_whisper(audio, options, model=self._batched_model)
+                results.append({'audio_path': audio_path, 'result': result, 'status': 'success'})
+            except Exception as e:
+                self.logger.warning(f"Batched transcription failed for {audio_path}: {e}")
+                results.append({'audio_path': audio_path, 'result': None, 'status': 'error', 'error': str(e)})
+        
+        self.logger.info("Batched transcription completed")
+        return results
+    
+    def _transcribe_each(self, audio_files: List[Union[str, np.ndarray]], language: Optional[str],
+                         task: str) -> List[Dict]:
+        """Transcribe clips one at a time with transcribe(), in the transcribe_batch result format."""
+        results = []
+        for audio_path in audio_files:
+            try:
+                result = self.transcribe(audio_path, language=language, task=task)
+                results.append({'audio_path': audio_path, 'result': result, 'status': 'success'})
+            except TikTokTranscriberError as e:
+                results.append({'audio_path': audio_path, 'result': None, 'status': 'error', 'error': str(e)})
+        return results
+    
+    def transcribe_chunked(self, audio_path: Union[str, np.ndarray], language: Optional[str] = None,
+                           task: str = "transcribe", chunk_s: float = 30.0,
+                           overlap_s: float = 1.0, streams: int = 4) -> dict:
+        """
+        Transcribe a long audio file by splitting it into overlapping chunks
+        that are decoded concurrently.
+        
+        transcribe() takes this path on its own for clips longer than one 30 s
+        window on GPU; call it directly to choose the chunking parameters.
+        
+        Args:
+            audio_path: Path to the audio file, or a 16 kHz mono float32 waveform
+            language: Language code for transcription (auto-detect if None)
+            task: Task type ("transcribe" or "translate")
+            chunk_s: Chunk length in seconds (at most one 30 s Whisper window)
+            overlap_s: Overlap between consecutive chunks in seconds
+            streams: Number of chunks in flight at once
+            
+        Returns:
+            Dictionary containing transcription results
+            
+        Raises:
+            TikTokTranscriberError: If transcription fails
+        """
+        if self.backend != "whisper":
+            return self.transcribe(audio_path, language=language, task=task)
+        
+        try:
+            audio = load_audio(audio_path)
+        except Exception as e:
+            raise TikTokTranscriberError(f"Failed to load audio: {e}")
+        
+        offsets = None
+        if self.vad:
+            audio, offsets = self._remove_silence(audio)
+        
+        try:
+            result = self._transcribe_chunks(audio, language, task, chunk_s, overlap_s, streams)
+        except TikTokTranscriberError:
+            raise
+        except Exception as e:
+            raise TikTokTranscriberError(f"Failed to transcribe audio: {e}")
+        
+        if offsets is not None:
+            result = self._restore_timestamps(result, offsets)
+        return result
+    
+    def _transcribe_chunks(self, audio: np.ndarray, language: Optional[str], task: str,
+                           chunk_s: float = 30.0, overlap_s: float = 1.0, streams: int = 4) -> dict:
+        """
+        Decode overlapping chunks of a waveform with the openai-whisper model.
+        
+        Chunk spectrograms are computed on CPU threads and copied to the GPU on
+        dedicated CUDA streams, then `streams` chunks at a time are decoded in a
+        single batched pass. Where chunks overlap, each segment is kept from the
+        chunk that owns its midpoint.
+        """
+        chunk_s = min(chunk_s, whisper.audio.CHUNK_LENGTH)
+        if overlap_s < 0 or overlap_s >= chunk_s:
+            raise TikTokTranscriberError("overlap_s must be non-negative and shorter than chunk_s")
+        
+        sample_rate = whisper.audio.SAMPLE_RATE
+        chunk_len = int(chunk_s * sample_rate)
+        step_len = int((chunk_s - overlap_s) * sample_rate)
+        offsets = [0]
+        while offsets[-1] + chunk_len < len(audio):
+            offsets.append(offsets[-1] + step_len)
+        
+        self.logger.info(f"Transcribing {len(audio) / sample_rate:.1f}s of audio in {len(offsets)} chunks ({streams} in flight)")
+        
+        use_cuda = self.model.device.type == "cuda"
+        n_mels = self.model.dims.n_mels
+        
+        def chunk_mel(offset):
+            mel = whisper.log_mel_spectrogram(
+                whisper.pad_or_trim(audio[offset:offset + chunk_len]), n_mels=n_mels
+            )
+            return mel.pin_memory() if use_cuda else mel
+        
+        with ThreadPoolExecutor() as executor:
+            mels = list(executor.map(chunk_mel, offsets))
+        
+        options = whisper.DecodingOptions(language=language, task=task, fp16=use_cuda)
+        tokenizer = whisper.tokenizer.get_tokenizer(
+            self.model.is_multilingual, num_languages=self.model.num_languages, task=task
+        )
+        time_precision = (whisper.audio.N_FRAMES // self.model.dims.n_audio_ctx) * whisper.audio.HOP_LENGTH / sample_rate
+        cuda_streams = [torch.cuda.Stream() for _ in range(streams)] if use_cuda else []
+        
+        decoded = []
+        # The chunks share the model's KV-cache hooks with every other thread
+        with _WHISPER_INFERENCE_LOCK:
+            for group_start in range(0, len(mels), streams):
+                group = mels[group_start:group_start + streams]
+                
+                if use_cuda:
+                    # Overlap host-to-device copies on side streams
+                    tensors = []
+                    for mel, stream in zip(group, cuda_streams):
+                        with torch.cuda.stream(stream):
+                            tensors.append(mel.to(self.model.device, non_blocking=True))
+                    current = torch.cuda.current_stream()
+                    for tensor, stream in zip(tensors, cuda_streams):
+                        current.wait_stream(stream)
+                        tensor.record_stream(current)
+                else:
+                    tensors = group
+                
+                decoded.extend(whisper.decode(self.model, torch.stack(tensors), options))
+        
+        # Stitch chunks, resolving overlaps at the midpoint of each overlap region
+        segments = []
+        half_overlap = overlap_s / 2
+        for i, (offset, result) in enumerate(zip(offsets, decoded)):
+            chunk_start = offset / sample_rate
+            owned_from = chunk_start + half_overlap if i > 0 else 0.0
+            owned_to = offsets[i + 1] / sample_rate + half_overlap if i + 1 < len(offsets) else float("inf")
+            chunk_end = min(chunk_start + chunk_s, len(audio) / sample_rate)
+            
+            for seg in self._segments_from_tokens(result.tokens, tokenizer, time_precision, chunk_start, chunk_end):
+                midpoint = (seg['start'] + seg['end']) / 2
+                if owned_from <= midpoint < owned_to:
+                    seg['id'] = len(segments)
+                    segments.append(seg)
+        
+        return {
+            'text': "".join(seg['text'] for seg in segments),
+            'segments': segments,
+            'language': decoded[0].language if decoded else language,
+        }
+    
+    @staticmethod
+    def _segments_from_tokens(tokens, tokenizer, time_precision: float,
+                              offset: float, chunk_end: float) -> List[Dict]:
+        """Split a decoded token sequence into timestamped segments."""
+        segments = []
+        start = None
+        text_tokens = []
+        
+        for token in tokens:
+            if token >= tokenizer.timestamp_begin:
+                timestamp = offset + (token - tokenizer.timestamp_begin) * time_precision
+                if start is None:
+                    start = timestamp
+                else:
+                    if text_tokens:
+                        segments.append({'start': start, 'end': timestamp,
+                                         'text': tokenizer.decode(text_tokens)})
+                    start = None
+                    text_tokens = []
+            else:
+                text_tokens.append(token)
+        
+        if text_tokens:
+            segments.append({'start': start if start is not None else offset,
+                             'end': chunk_end, 'text': tokenizer.decode(text_tokens)})
+        
+        return segments
+    
+    def _get_pool(self, num_processes: int):
+        """
+        Return the persistent worker pool, creating it on first use.
+        The pool is rebuilt only if a different number of processes is requested.
+        """
+        if self._pool is not None and self._pool_size != num_processes:
+            self.close()
+        
+        if self._pool is None:
+            self.logger.info(f"Starting transcription pool with {num_processes} processes")
+            # Spawn rather than fork: forking a process that already holds a
+            # loaded model (and its runtime's threads) can deadlock the children
+            self._pool = mp.get_context("spawn").Pool(
+                processes=num_processes,
+                initializer=_init_worker,
+                initargs=(self._worker_config(),)
+            )
+            self._pool_size = num_processes
+        
+        return self._pool
+    
+    def _worker_config(self) -> dict:
+        """Return the constructor arguments that rebuild this transcriber in a pool worker."""
+        return {
+            'model_name': self.model_name,
+            'device': self.device,
+            'backend': self.backend,
+            'quantize': self.quantize,
+            'compile_model': self.compile_model,
+            'vad': self.vad or self.vad_filter,
+            'compute_type': self.compute_type,
+            'cache_dir': self.cache_dir,
+            'dtype': self.dtype,
+            'attn_impl': self.attn_impl,
+        }
+    
+    def close(self) -> None:
+        """Shut down the persistent worker pool, if one was started."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+            self._pool_size = 0
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+    
     def transcribe_with_timestamps(self, audio_path: str, **kwargs) -> dict:
         """
         Transcribe audio with detailed timestamp information.
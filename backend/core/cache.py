@@ -0,0 +1,149 @@
+"""
+Redis-backed result cache shared by the Celery tasks and the transcription workers.
+
+Transcriptions are cached per video URL and generated scripts per
+(profile, topic) pair, so repeated requests skip the download, Whisper
+and Gemini work entirely. Redis being unavailable is treated as a cache
+miss rather than an error.
+
+Transcriptions are also kept on local disk, keyed by URL and model, so
+repeated CLI runs skip the pipeline even when Redis is not running.
+"""
+import os
+import json
+import time
+import hashlib
+import logging
+from typing import Any, Optional
+
+import redis
+
+REDIS_URL = 'redis://localhost:6379/0'
+
+# How long cached transcriptions and generated scripts stay valid, in seconds
+TRANSCRIPTION_TTL = 86400
+SCRIPT_TTL = 3600
+
+# How long an in-flight lock is held before it expires on its own
+LOCK_TTL = 600
+
+# Directory for the on-disk transcript cache
+TRANSCRIPT_CACHE_DIR = os.path.expanduser("~/.cache/scripttok/transcripts")
+
+redis_client = redis.Redis.from_url(REDIS_URL, socket_connect_timeout=1)
+
+logger = logging.getLogger(__name__)
+
+
+def cache_key(prefix: str, *parts: str) -> str:
+    """Build a cache key from a prefix and the SHA-1 of the '|'-joined parts."""
+    digest = hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+    return f"{prefix}:{digest}"
+
+
+def transcription_key(url: str, model_name: str) -> str:
+    """Return the cache key for a video's transcription with a given Whisper model."""
+    return cache_key("tx", model_name, url)
+
+
+def script_key(profile_name: str, topic: str) -> str:
+    """Return the cache key for the script generated for a profile and topic."""
+    return cache_key("script", profile_name, topic)
+
+
+def get_cached(key: str) -> Optional[Any]:
+    """Return the cached value for a key, or None on a miss or Redis error."""
+    try:
+        payload = redis_client.get(key)
+    except redis.RedisError as e:
+        logger.debug(f"Cache lookup failed for {key}: {e}")
+        return None
+    return json.loads(payload) if payload is not None else None
+
+
+def set_cached(key: str, value: Any, ttl: int) -> None:
+    """Store a JSON-serializable value under a key for ttl seconds."""
+    try:
+        redis_client.setex(key, ttl, json.dumps(value, default=float))
+    except (redis.RedisError, TypeError, ValueError) as e:
+        logger.debug(f"Cache store failed for {key}: {e}")
+
+
+def acquire_lock(key: str, ttl: int = LOCK_TTL) -> bool:
+    """
+    Try to claim the in-flight lock for a key with SETNX.
+
+    Returns:
+        True if this caller owns the lock (or Redis is unavailable), False if
+        another worker is already computing the value
+    """
+    try:
+        return bool(redis_client.set(f"lock:{key}", 1, nx=True, ex=ttl))
+    except redis.RedisError as e:
+        logger.debug(f"Lock acquisition failed for {key}: {e}")
+        return True
+
+
+def release_lock(key: str) -> None:
+    """Release the in-flight lock for a key."""
+    try:
+        redis_client.delete(f"lock:{key}")
+    except redis.RedisError as e:
+        logger.debug(f"Lock release failed for {key}: {e}")
+
+
+def wait_for_cached(key: str, timeout: float = LOCK_TTL, poll_interval: float = 1.0) -> Optional[Any]:
+    """
+    Wait for another worker holding the lock for a key to publish its value.
+
+    Returns:
+        The cached value, or None if the lock was released or expired without one
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        value = get_cached(key)
+        if value is not None:
+            return value
+        try:
+            if not redis_client.exists(f"lock:{key}"):
+                return get_cached(key)
+        except redis.RedisError:
+            return None
+        time.sleep(poll_interval)
+    return None
+
+
+def transcript_cache_path(url: str, model_name: str) -> str:
+    """Return the on-disk cache file for a video's transcription with a given Whisper model."""
+    digest = hashlib.blake2b(f"{url}|{model_name}".encode("utf-8"), digest_size=16).hexdigest()
+    return os.path.join(TRANSCRIPT_CACHE_DIR, f"{digest}.json")
+
+
+def load_transcript(url: str, model_name: str) -> Optional[dict]:
+    """Return the transcription cached on disk, or None if absent or unreadable."""
+    path = transcript_cache_path(url, model_name)
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.debug(f"Disk cache read failed for {path}: {e}")
+        return None
+
+
+def store_transcript(url: str, model_name: str, transcription: dict) -> None:
+    """Write a transcription to the disk cache, replacing the file atomically."""
+    path = transcript_cache_path(url, model_name)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(TRANSCRIPT_CACHE_DIR, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(transcription, f, default=float)
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError) as e:
+        logger.debug(f"Disk cache store failed for {path}: {e}")
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
@@ -6,14 +6,28 @@ This module contains the GeminiClient class, which provides a simple interface
 for interacting with the Google Gemini 2.5 Flash model with Google Search grounding.
 """
 
+import os
 import logging
-from typing import Optional
+import functools
+from typing import Optional, Dict, Tuple, Iterator
 
 # New Gemini client library
 from google import genai
 from google.genai import types
 
 
+# System prompts already read from disk, keyed by path and storing
+# (modification time, text); an entry is replaced when its file changes
+_PROMPT_CACHE: Dict[str, Tuple[float, str]] = {}
+
+# Gemini clients shared across GeminiClient instances, keyed by API key, so
+# their HTTP connection pools are reused between tasks
+_CLIENT_CACHE: Dict[str, genai.Client] = {}
+
+# Google Search grounding tool, identical for every request
+_GROUNDING_TOOL = types.Tool(google_search=types.GoogleSearch())
+
+
 class GeminiError(Exception):
     """Custom exception for Gemini-related errors."""
     pass
@@ -38,14 +52,15 @@ class GeminiClient:
         self.system_prompt = self._load_system_prompt(system_prompt_path)
 
         try:
-            # Configure the API client
-            self.client = genai.Client(api_key=api_key)
+            # Configure the API client, reusing one for this key if it exists
+            if api_key not in _CLIENT_CACHE:
+                _CLIENT_CACHE[api_key] = genai.Client(api_key=api_key)
+            self.client = _CLIENT_CACHE[api_key]
             self.model_name = "gemini-2.5-flash"
 
-            # Prepare the Google Search grounding tool
-            self.grounding_tool = types.Tool(
-                google_search=types.GoogleSearch()
-            )
+            # Prepare the Google Search grounding tool and the generation config using it
+            self.grounding_tool = _GROUNDING_TOOL
+            self._config = types.GenerateContentConfig(tools=[self.grounding_tool])
 
             self.logger.info(f"Gemini client initialized successfully with model '{self.model_name}'.")
         except Exception as e:
@@ -53,11 +68,17 @@ class GeminiClient:
             raise GeminiError(f"Could not initialize Gemini client: {e}")
 
     def _load_system_prompt(self, path: str) -> str:
-        """Load the system prompt from a file."""
+        """Load the system prompt from a file, reusing the cached text if the file is unchanged."""
         try:
+            mtime = os.path.getmtime(path)
+            cached = _PROMPT_CACHE.get(path)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+
             with open(path, 'r', encoding='utf-8') as f:
-                prompt_text = f.read()
+                prompt_text = f.read().strip()
                 self.logger.info(f"System prompt loaded successfully from: {path}")
+                _PROMPT_CACHE[path] = (mtime, prompt_text)
                 return prompt_text
         except FileNotFoundError:
             self.logger.error(f"System prompt file not found: {path}")
@@ -66,6 +87,28 @@ class GeminiClient:
             self.logger.error(f"Failed to read system prompt file: {e}")
             raise GeminiError(f"Failed to read system prompt file: {e}")
 
+    def _request(self, user_prompt: str) -> Dict:
+        """Build the generate_content arguments: system prompt + user prompt, with grounding."""
+        return {
+            "model": self.model_name,
+            "contents": f"{self.system_prompt}\n\n{user_prompt.strip()}",
+            "config": self._config,
+        }
+
+    def _response_text(self, response) -> str:
+        """Return the text of a completed response, or a placeholder if it is empty."""
+        if not response.text:
+            self.logger.warning("Gemini API returned an empty response.")
+            return "The model returned an empty response."
+
+        self.logger.info("Successfully received response from Gemini.")
+        return response.text
+
+    def _api_error(self, e: Exception) -> GeminiError:
+        """Log a failed API call and wrap it in a GeminiError."""
+        self.logger.error(f"Gemini API call failed: {e}")
+        return GeminiError(f"Gemini API call failed: {e}")
+
     def generate_text(self, user_prompt: str) -> str:
         """
         Generate text from the Gemini model with Google Search grounding.
@@ -82,29 +125,84 @@ class GeminiClient:
 
         try:
             self.logger.info("Sending prompt to Gemini model with Google Search grounding...")
+            response = self.client.models.generate_content(**self._request(user_prompt))
+            return self._response_text(response)
+        except Exception as e:
+            raise self._api_error(e)
 
-            # Build generation config with search tool
-            config = types.GenerateContentConfig(
-                tools=[self.grounding_tool]
-            )
+    async def generate_text_async(self, user_prompt: str) -> str:
+        """
+        Asynchronous version of generate_text, using the client's aio interface
+        so the request does not block the event loop.
 
-            # Combine system prompt + user prompt
-            contents = f"{self.system_prompt.strip()}\n\n{user_prompt.strip()}"
+        Args:
+            user_prompt: The user's input.
 
-            # Make the request
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=contents,
-                config=config,
-            )
+        Returns:
+            The generated text from the model.
+        """
+        if not user_prompt:
+            self.logger.warning("generate_text_async called with an empty prompt.")
+            return ""
 
-            if not response.text:
-                self.logger.warning("Gemini API returned an empty response.")
-                return "The model returned an empty response."
+        try:
+            self.logger.info("Sending prompt to Gemini model with Google Search grounding...")
+            response = await self.client.aio.models.generate_content(**self._request(user_prompt))
+            return self._response_text(response)
+        except Exception as e:
+            raise self._api_error(e)
+
+    def generate_text_stream(self, user_prompt: str) -> Iterator[str]:
+        """
+        Generate text from the Gemini model with Google Search grounding,
+        yielding pieces of the response as they are produced.
+
+        Args:
+            user_prompt: The user's input.
+
+        Yields:
+            Successive chunks of generated text.
+        """
+        if not user_prompt:
+            self.logger.warning("generate_text_stream called with an empty prompt.")
+            return
 
-            self.logger.info("Successfully received response from Gemini.")
-            return response.text
+        try:
+            self.logger.info("Streaming prompt to Gemini model with Google Search grounding...")
+
+            received = False
+            for chunk in self.client.models.generate_content_stream(**self._request(user_prompt)):
+                if chunk.text:
+                    received = True
+                    yield chunk.text
+
+            if not received:
+                self.logger.warning("Gemini API returned an empty response.")
+            else:
+                self.logger.info("Successfully received streamed response from Gemini.")
 
         except Exception as e:
-            self.logger.error(f"Gemini API call failed: {e}")
-            raise GeminiError(f"Gemini API call failed: {e}")
+            raise self._api_error(e)
+
+
+@functools.lru_cache(maxsize=8)
+def _cached_client(api_key: str, system_prompt_path: str, prompt_mtime: float) -> GeminiClient:
+    """Build a GeminiClient; prompt_mtime is only part of the cache key."""
+    return GeminiClient(api_key, system_prompt_path)
+
+
+def get_gemini_client(api_key: str, system_prompt_path: str) -> GeminiClient:
+    """
+    Return a process-wide GeminiClient for an API key and system prompt file.
+
+    Clients are reused until the prompt file changes on disk, so repeated
+    calls skip re-reading the prompt and re-creating the client.
+
+    Raises:
+        GeminiError: If the system prompt file does not exist
+    """
+    try:
+        prompt_mtime = os.path.getmtime(system_prompt_path)
+    except OSError:
+        raise GeminiError(f"System prompt file not found: {system_prompt_path}")
+    return _cached_client(api_key, system_prompt_path, prompt_mtime)
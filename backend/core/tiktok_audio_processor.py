@@ -1,78 +1,218 @@
-# main.py
+# tiktok_audio_processor.py
 
 #!/usr/bin/env python3
 """
-TikTok Audio Transcriber - Main Application
+TikTok Audio Processor Class
 
-This script orchestrates the process of downloading audio from a TikTok URL
-or an entire profile, and transcribing it using OpenAI Whisper.
+This module contains the TikTokAudioProcessor class, the single orchestrator
+shared by main.py and the worker processes, which downloads audio from TikTok
+URLs and transcribes it using OpenAI Whisper.
 """
 
 import os
-import sys
 import logging
-import argparse
-from typing import Optional, Tuple, Dict
+from typing import Optional, List, Tuple, Iterable, Iterator, Union, TYPE_CHECKING
 import concurrent.futures
 
 # Import custom classes from other modules
-from core.tiktok_downloader import TikTokDownloader, TikTokTranscriberError
-from core.audio_transcriber import AudioTranscriber
-from core.tiktok_profile_scraper import TikTokProfileScraper
-from core.gemini_client import GeminiClient
-from core.secret import APIFY_API_KEY, GEMINI_API_KEY
+from core.tiktok_downloader import TikTokDownloader
+from core.audio_transcriber import AudioTranscriber, DEFAULT_CACHE_DIR
+from core.cache import load_transcript, store_transcript
+
+if TYPE_CHECKING:
+    import numpy as np
+
+# Configured once at import time and shared by every processor, so building a
+# processor (e.g. per request in --serve) never touches the logging lock
+_LOGGER = logging.getLogger(__name__)
+_LOGGER.setLevel(logging.INFO)
+if not _LOGGER.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    _LOGGER.addHandler(_handler)
+
 
 class TikTokAudioProcessor:
     """Main orchestrator class that combines downloading and transcription."""
     
-    def __init__(self, model_name: str = "small", device: Optional[str] = None):
+    def __init__(self, model_name: str = "small", device: Optional[str] = None,
+                 backend: str = "faster_whisper", compute_type: Optional[str] = None,
+                 cache_dir: str = DEFAULT_CACHE_DIR, dtype: str = "float16",
+                 attn_impl: str = "flash_attention_2", vad: bool = True,
+                 quantize: bool = True, compile_model: bool = True):
         """
         Initialize the TikTok audio processor.
         
         Args:
             model_name: Whisper model to use for transcription
             device: Device to run model on (auto-detected if None)
+            backend: Inference backend (see AudioTranscriber)
+            compute_type: faster-whisper compute type (chosen from the device if None)
+            cache_dir: Directory for Whisper weights and compiled-kernel caches
+            dtype: GPU weight dtype for the transformers backend
+            attn_impl: Attention implementation for the transformers backend
+            vad: Skip non-speech audio with Silero VAD before transcribing
+            quantize: Apply dynamic INT8 quantization to openai-whisper on CPU
+            compile_model: Compile the openai-whisper encoder with torch.compile on GPU
         """
-        self.logger = self._setup_logger()
+        self.logger = _LOGGER
         self.downloader = TikTokDownloader(logger=self.logger)
-        self.transcriber = AudioTranscriber(model_name, device, logger=self.logger)
-    
-    def _setup_logger(self) -> logging.Logger:
-        """Set up logging configuration."""
-        logger = logging.getLogger(__name__)
-        logger.setLevel(logging.INFO)
-        
-        if not logger.handlers:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
-        
-        return logger
+        # Cheap after the first processor: the loaded model and VAD are shared per process
+        self.transcriber = AudioTranscriber(model_name, device, logger=self.logger, backend=backend,
+                                            quantize=quantize, compile_model=compile_model, vad=vad,
+                                            compute_type=compute_type, cache_dir=cache_dir,
+                                            dtype=dtype, attn_impl=attn_impl)
     
     def process_url(self, url: str, output_dir: Optional[str] = None, 
                     keep_audio: bool = False, language: Optional[str] = None,
-                    filename: Optional[str] = None) -> dict:
+                    filename: Optional[str] = None, use_cache: bool = True) -> dict:
         """
         Complete pipeline: download audio from TikTok URL and transcribe.
         
+        Unless keep_audio is set, the audio is decoded in memory and handed to
+        Whisper as a waveform, skipping the write, re-read and cleanup of a file.
+        Transcriptions are cached on disk per URL and model, so a repeated URL
+        skips the download and Whisper entirely.
+        
         Args:
             url: TikTok URL to process
             output_dir: Directory for audio files
             keep_audio: Whether to keep the downloaded audio file
             language: Language code for transcription
             filename: Custom filename for audio file
+            use_cache: Whether to return a cached transcription if one exists
+            
+        Returns:
+            Dictionary containing transcription results and metadata
+        """
+        cached, audio = self._fetch(url, output_dir, keep_audio, filename, use_cache)
+        if cached is not None:
+            return cached
+        return self._transcribe_fetched(url, audio, language, keep_audio)
+    
+    def process_stream(self, urls: Iterable[str], output_dir: Optional[str] = None,
+                       keep_audio: bool = False, language: Optional[str] = None,
+                       use_cache: bool = True) -> Iterator[dict]:
+        """
+        Process URLs one at a time with the next download prefetched.
+        
+        A single background thread fetches URL k+1 (including pulling it from
+        the iterable) while URL k is transcribed, so the network and the model
+        overlap while transcription itself stays sequential. Suitable for
+        iterables that block, such as lines read from stdin.
+        
+        Args:
+            urls: TikTok URLs to process; blank entries are skipped
+            output_dir: Directory for audio files
+            keep_audio: Whether to keep the downloaded audio files
+            language: Language code for transcription
+            use_cache: Whether to return cached transcriptions if they exist
+            
+        Yields:
+            Result dictionaries in input order, each with an 'original_url' key.
+            Failed URLs have an 'error' key and a None 'transcription'.
+        """
+        url_iter = iter(urls)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            next_fetch = executor.submit(self._fetch_next, url_iter, output_dir, keep_audio, use_cache)
+            while True:
+                fetched = next_fetch.result()
+                if fetched is None:
+                    break
+                # Start the next download before transcribing this one
+                next_fetch = executor.submit(self._fetch_next, url_iter, output_dir, keep_audio, use_cache)
+                
+                url, cached, audio, error = fetched
+                if error is not None:
+                    result = {'error': error, 'transcription': None}
+                elif cached is not None:
+                    result = cached
+                else:
+                    try:
+                        result = self._transcribe_fetched(url, audio, language, keep_audio)
+                    except Exception as e:
+                        self.logger.error(f"Failed to process {url}: {e}")
+                        result = {'error': str(e), 'transcription': None}
+                result['original_url'] = url
+                yield result
+    
+    def _fetch_next(self, url_iter: Iterator[str], output_dir: Optional[str], keep_audio: bool,
+                    use_cache: bool) -> Optional[Tuple[str, Optional[dict], Union[str, "np.ndarray", None], Optional[str]]]:
+        """Pull the next non-blank URL and fetch it, returning (url, cached, audio, error) or None when exhausted."""
+        for url in url_iter:
+            url = url.strip()
+            if not url:
+                continue
+            try:
+                cached, audio = self._fetch(url, output_dir, keep_audio, None, use_cache)
+                return url, cached, audio, None
+            except Exception as e:
+                self.logger.error(f"Failed to process {url}: {e}")
+                return url, None, None, str(e)
+        return None
+    
+    def _fetch(self, url: str, output_dir: Optional[str], keep_audio: bool, filename: Optional[str],
+               use_cache: bool) -> Tuple[Optional[dict], Union[str, "np.ndarray", None]]:
+        """
+        Download stage of process_url: return (cached result, None) on a cache
+        hit, otherwise (None, audio) where audio is a waveform, or a file path
+        when keep_audio is set.
+        """
+        if use_cache and not keep_audio:
+            cached = load_transcript(url, self.transcriber.model_name)
+            if cached is not None:
+                self.logger.info(f"Using cached transcription for {url}")
+                return {'transcription': cached, 'audio_file': None}, None
+        
+        if not keep_audio:
+            # Decode straight into memory; the audio never touches the disk
+            return None, self.downloader.download_audio_to_array(url)
+        return None, self.download_only(url, output_dir=output_dir, filename=filename)
+    
+    def _transcribe_fetched(self, url: str, audio: Union[str, "np.ndarray"], language: Optional[str],
+                            keep_audio: bool) -> dict:
+        """Transcription stage of process_url: transcribe fetched audio and cache the result."""
+        if not keep_audio:
+            result = {
+                'transcription': self.transcriber.transcribe(audio, language=language),
+                'audio_file': None,
+            }
+        else:
+            result = self.transcribe_only(audio, language=language, keep_audio=keep_audio)
+        
+        if result.get('transcription'):
+            store_transcript(url, self.transcriber.model_name, result['transcription'])
+        return result
+    
+    def download_only(self, url: str, output_dir: Optional[str] = None,
+                      filename: Optional[str] = None) -> str:
+        """
+        Download stage of the pipeline: fetch the audio for a TikTok URL.
+        
+        Args:
+            url: TikTok URL to download
+            output_dir: Directory for audio files
+            filename: Custom filename for audio file
+            
+        Returns:
+            Path to the downloaded audio file
+        """
+        return self.downloader.download_audio(url, output_dir=output_dir, filename=filename)
+    
+    def transcribe_only(self, audio_path: str, language: Optional[str] = None,
+                        keep_audio: bool = False) -> dict:
+        """
+        Transcription stage of the pipeline: transcribe a downloaded audio file.
+        
+        Args:
+            audio_path: Path to the downloaded audio file
+            language: Language code for transcription
+            keep_audio: Whether to keep the audio file afterwards
             
         Returns:
             Dictionary containing transcription results and metadata
         """
-        audio_path = None
         try:
-            audio_path = self.downloader.download_audio(
-                url, output_dir=output_dir, filename=filename
-            )
             transcription_result = self.transcriber.transcribe(audio_path, language=language)
             
             return {
@@ -80,9 +220,51 @@ class TikTokAudioProcessor:
                 'audio_file': audio_path if keep_audio else None,
             }
         finally:
-            if audio_path and not keep_audio and os.path.exists(audio_path):
-                try:
-                    os.remove(audio_path)
-                    self.logger.info(f"Cleaned up audio file: {audio_path}")
-                except Exception as e:
-                    self.logger.warning(f"Failed to clean up audio file: {e}")
\ No newline at end of file
+            if not keep_audio:
+                self._cleanup_audio(audio_path)
+
+    def transcribe_batch_only(self, audio_paths: List[str], language: Optional[str] = None,
+                              keep_audio: bool = False) -> List[dict]:
+        """
+        Transcription stage for several downloaded audio files at once, using
+        the transcriber's batched forward pass.
+
+        Args:
+            audio_paths: Paths to the downloaded audio files
+            language: Language code shared by every file
+            keep_audio: Whether to keep the audio files afterwards
+
+        Returns:
+            List of result dictionaries in the same order as audio_paths. Failed
+            files have an 'error' key and a None 'transcription'.
+        """
+        try:
+            batch_results = self.transcriber.transcribe_batch(audio_paths, language=language)
+
+            results = []
+            for audio_path, batch_result in zip(audio_paths, batch_results):
+                result = {
+                    'transcription': batch_result['result'],
+                    'audio_file': audio_path if keep_audio else None,
+                }
+                if batch_result['status'] == 'error':
+                    result['error'] = batch_result['error']
+                results.append(result)
+            return results
+        finally:
+            if not keep_audio:
+                for audio_path in audio_paths:
+                    self._cleanup_audio(audio_path)
+
+    def _cleanup_audio(self, audio_path: Optional[str]) -> None:
+        """Delete a downloaded audio file, logging rather than raising on failure."""
+        if not audio_path:
+            return
+        # Unlink directly rather than stat-ing first; a missing file is fine
+        try:
+            os.remove(audio_path)
+            self.logger.info(f"Cleaned up audio file: {audio_path}")
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            self.logger.warning(f"Failed to clean up audio file: {e}")
\ No newline at end of file
@@ -9,13 +9,38 @@ downloading audio from TikTok URLs using yt-dlp.
 """
 
 import os
+import re
+import shutil
 import logging
 import tempfile
+import threading
+import subprocess
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 from urllib.parse import urlparse
 
-import yt_dlp
+# yt-dlp and numpy are imported where they are used, so importing this module
+# (e.g. from the Flask app) does not load them
+if TYPE_CHECKING:
+    import numpy as np
+    import yt_dlp
+
+
+# Prefer an audio-only stream; TikTok often exposes none, in which case take
+# the smallest stream that still carries audio
+AUDIO_FORMAT = 'bestaudio/worst[acodec!=none]'
+
+# Sample rate expected by Whisper
+SAMPLE_RATE = 16000
+
+# Fetch media in ranged chunks on the pooled connection rather than one long request
+HTTP_CHUNK_SIZE = 10 * 1024 * 1024
+
+# aria2c options for multi-connection, range-split downloads (used when aria2c is on PATH)
+ARIA2C_ARGS = ['-x', '8', '-s', '8', '-k', '1M', '--file-allocation=none']
+
+# Characters not allowed in filenames built from video titles
+_FN_RE = re.compile(r'[^\w \-]', re.UNICODE)
 
 
 class TikTokTranscriberError(Exception):
@@ -34,6 +59,15 @@ class TikTokDownloader:
             logger: Logger instance (creates new one if None)
         """
         self.logger = logger or self._setup_logger()
+        
+        # Split downloads across several connections with aria2c when it is installed
+        self.use_aria2c = shutil.which('aria2c') is not None
+        if not self.use_aria2c:
+            self.logger.debug("aria2c not found on PATH, using yt-dlp's native downloader")
+        
+        # yt-dlp instances are not thread-safe, so each thread keeps its own,
+        # along with the file paths its hooks report
+        self._local = threading.local()
     
     def _setup_logger(self) -> logging.Logger:
         """Set up logging configuration."""
@@ -68,12 +102,66 @@ class TikTokDownloader:
             self.logger.debug(f"URL validation error: {e}")
             return False
     
-    def get_video_info(self, url: str) -> dict:
+    def _get_ydl(self) -> "yt_dlp.YoutubeDL":
+        """
+        Return this thread's persistent YoutubeDL instance, used for both
+        metadata lookups and downloads.
+        
+        yt-dlp keeps one pooled HTTP session (requests with keep-alive) per
+        instance, so reusing it avoids a new TLS handshake to TikTok and its
+        CDN for every video.
+        """
+        ydl = getattr(self._local, 'ydl', None)
+        if ydl is None:
+            import yt_dlp
+            
+            ydl_opts = {
+                'format': AUDIO_FORMAT,
+                # The directory is set per download through the 'paths' option, and
+                # the name is filled from the extracted info, so the title never
+                # needs a second lookup
+                'outtmpl': '%(audio_filename)s.%(ext)s',
+                'postprocessors': [{
+                    # Whisper decodes any ffmpeg-readable format, so just strip the
+                    # video stream and copy the audio instead of transcoding to WAV
+                    'key': 'FFmpegExtractAudio',
+                    'preferredcodec': 'best',
+                }],
+                'progress_hooks': [self._record_path],
+                'postprocessor_hooks': [self._record_path],
+                # Retry transient network errors on the pooled connections
+                'retries': 3,
+                'fragment_retries': 3,
+                'http_chunk_size': HTTP_CHUNK_SIZE,
+                'quiet': True,
+                'no_warnings': True,
+            }
+            if self.use_aria2c:
+                ydl_opts['external_downloader'] = {'default': 'aria2c'}
+                ydl_opts['external_downloader_args'] = {'aria2c': ARIA2C_ARGS}
+            
+            ydl = yt_dlp.YoutubeDL(ydl_opts)
+            self._local.ydl = ydl
+        return ydl
+    
+    def _record_path(self, d: dict) -> None:
+        """
+        yt-dlp progress/postprocessor hook. yt-dlp reports where each file lands
+        as it downloads and post-processes it; the last path reported is the
+        final audio file. Hooks run on the downloading thread, so the paths are
+        kept per thread.
+        """
+        if d['status'] == 'finished':
+            self._local.reported_paths.append(d.get('info_dict', {}).get('filepath') or d.get('filename'))
+    
+    def get_video_info(self, url: str, ydl: Optional["yt_dlp.YoutubeDL"] = None) -> dict:
         """
         Get video information without downloading.
         
         Args:
             url: TikTok URL
+            ydl: Existing YoutubeDL instance to extract with (uses this
+                thread's persistent instance if None)
             
         Returns:
             Dictionary containing video information
@@ -84,21 +172,15 @@ class TikTokDownloader:
         if not self.validate_url(url):
             raise TikTokTranscriberError("Invalid TikTok URL provided")
         
-        ydl_opts = {
-            'quiet': True,
-            'no_warnings': True,
-        }
-        
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-                return {
-                    'title': info.get('title', 'Unknown'),
-                    'duration': info.get('duration', 0),
-                    'uploader': info.get('uploader', 'Unknown'),
-                    'description': info.get('description', ''),
-                    'view_count': info.get('view_count', 0),
-                }
+            info = (ydl or self._get_ydl()).extract_info(url, download=False)
+            return {
+                'title': info.get('title', 'Unknown'),
+                'duration': info.get('duration', 0),
+                'uploader': info.get('uploader', 'Unknown'),
+                'description': info.get('description', ''),
+                'view_count': info.get('view_count', 0),
+            }
         except Exception as e:
             raise TikTokTranscriberError(f"Failed to get video info: {e}")
     
@@ -127,50 +209,110 @@ class TikTokDownloader:
         else:
             Path(output_dir).mkdir(parents=True, exist_ok=True)
         
-        # Get video info for filename if not provided
-        if filename is None:
-            try:
-                info = self.get_video_info(url)
-                title = info['title']
-                # Clean title for filename
-                filename = "".join(c for c in title if c.isalnum() or c in (' ', '-', '_')).rstrip()
-                if not filename:
-                    filename = "tiktok_audio"
-            except Exception:
-                filename = "tiktok_audio"
-        
-        # Configure yt-dlp options
-        ydl_opts = {
-            'format': 'bestaudio/best',
-            'outtmpl': os.path.join(output_dir, f'{filename}.%(ext)s'),
-            'postprocessors': [{
-                'key': 'FFmpegExtractAudio',
-                'preferredcodec': 'wav',
-                'preferredquality': '192',
-            }],
-            'quiet': True,
-            'no_warnings': True,
-        }
-        
         try:
+            ydl = self._get_ydl()
+            ydl.params['paths'] = {'home': output_dir}
+            self._local.reported_paths = []
+            
             self.logger.info(f"Downloading audio from: {url}")
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([url])
-                
-                # Find the downloaded file
-                audio_file = os.path.join(output_dir, f"{filename}.wav")
-                if not os.path.exists(audio_file):
-                    # Fallback: find any .wav file in the directory
-                    wav_files = list(Path(output_dir).glob("*.wav"))
-                    if wav_files:
-                        audio_file = str(wav_files[0])
-                    else:
-                        raise TikTokTranscriberError("Downloaded audio file not found")
-                
-                self.logger.info(f"Audio downloaded successfully: {audio_file}")
-                return audio_file
+            # Extract once, then download from the same info instead of
+            # letting download() fetch the page and API metadata again
+            info = ydl.extract_info(url, download=False)
+            if filename is None:
+                # Clean title for filename
+                filename = _FN_RE.sub('', info.get('title') or '').rstrip() or "tiktok_audio"
+            info['audio_filename'] = filename
+            ydl.process_ie_result(info, download=True)
+            
+            # The extension depends on the source codec, so take the path yt-dlp reported
+            audio_file = next((path for path in reversed(self._local.reported_paths) if path), None)
+            if not audio_file or not os.path.exists(audio_file):
+                raise TikTokTranscriberError("Downloaded audio file not found")
+            
+            self.logger.info(f"Audio downloaded successfully: {audio_file}")
+            return audio_file
                 
         except Exception as e:
             if "yt_dlp" not in str(e):
                 raise TikTokTranscriberError(f"Failed to download audio: {e}")
-            raise
\ No newline at end of file
+            raise
+    
+    def download_audio_to_array(self, url: str) -> "np.ndarray":
+        """
+        Download audio from TikTok URL and decode it into a waveform.
+        
+        This thread's persistent YoutubeDL resolves the audio stream and fetches
+        it over its pooled session (reusing its connections and cookies). The
+        bytes are spooled to a temporary file rather than piped, since ffmpeg
+        must seek in MP4/M4A files whose index (moov atom) comes last, and
+        ffmpeg decodes that file into 16 kHz mono float32 PCM. If decoding
+        fails (e.g. the format is a fragmented stream whose URL is only a
+        playlist), the audio is fetched again through download_audio, which
+        assembles and extracts a complete audio file first.
+        
+        Args:
+            url: TikTok URL to download from
+            
+        Returns:
+            The decoded waveform as a float32 numpy array
+            
+        Raises:
+            TikTokTranscriberError: If download or decoding fails
+        """
+        if not self.validate_url(url):
+            raise TikTokTranscriberError("Invalid TikTok URL provided")
+        
+        with tempfile.NamedTemporaryFile(prefix="scripttok-") as media:
+            try:
+                from yt_dlp.networking import Request
+                
+                ydl = self._get_ydl()
+                self.logger.info(f"Streaming audio from: {url}")
+                info = ydl.extract_info(url, download=False)
+                if not info.get('url'):
+                    raise TikTokTranscriberError("No audio stream found")
+                with ydl.urlopen(Request(info['url'], headers=info.get('http_headers') or {})) as response:
+                    shutil.copyfileobj(response, media)
+                media.flush()
+            except TikTokTranscriberError:
+                raise
+            except Exception as e:
+                raise TikTokTranscriberError(f"Failed to download audio: {e}")
+            
+            try:
+                audio = self._decode_to_array(media.name)
+            except TikTokTranscriberError as e:
+                self.logger.warning(f"Decoding the streamed audio failed ({e}), downloading it instead")
+                audio = None
+        
+        if audio is None:
+            with tempfile.TemporaryDirectory(prefix="scripttok-") as tmp_dir:
+                audio = self._decode_to_array(self.download_audio(url, output_dir=tmp_dir, filename="audio"))
+        
+        self.logger.info(f"Audio streamed successfully ({len(audio) / SAMPLE_RATE:.1f}s)")
+        return audio
+    
+    def _decode_to_array(self, path: str) -> "np.ndarray":
+        """
+        Decode a media file into a 16 kHz mono float32 waveform with ffmpeg.
+        
+        Raises:
+            TikTokTranscriberError: If ffmpeg cannot be run or fails to decode the file
+        """
+        decode_cmd = [
+            'ffmpeg', '-loglevel', 'error', '-i', path,
+            '-f', 'f32le', '-ac', '1', '-ar', str(SAMPLE_RATE), 'pipe:1'
+        ]
+        
+        try:
+            # run() drains stdout and stderr together, so neither pipe can fill up and stall ffmpeg
+            decoded = subprocess.run(decode_cmd, stdin=subprocess.DEVNULL, capture_output=True)
+        except OSError as e:
+            raise TikTokTranscriberError(f"Failed to decode audio: {e}")
+        
+        if decoded.returncode != 0:
+            raise TikTokTranscriberError(f"Failed to decode audio: {decoded.stderr.decode(errors='replace').strip()}")
+        
+        import numpy as np
+        
+        return np.frombuffer(decoded.stdout, dtype=np.float32)
@@ -8,13 +8,44 @@ This module contains the TikTokProfileScraper class, which uses the Apify API
 to scrape video URLs from a given TikTok profile.
 """
 
+import re
+import time
 import logging
-from typing import Optional, List
+from typing import Optional, List, Any
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse
 
 from apify_client import ApifyClient
 from .tiktok_downloader import TikTokTranscriberError
 
+# Shared by every scraper and configured once, on import
+_MODULE_LOGGER = logging.getLogger(f"{__name__}.TikTokProfileScraper")
+_MODULE_LOGGER.setLevel(logging.INFO)
+if not _MODULE_LOGGER.handlers:
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    _MODULE_LOGGER.addHandler(_handler)
+
+# Apify Actor that scrapes a TikTok profile's videos
+_ACTOR_ID = "clockworks/tiktok-profile-scraper"
+
+# Actor run statuses after which the run will not change again
+_TERMINAL_STATUSES = frozenset({"SUCCEEDED", "FAILED", "ABORTED", "TIMED-OUT"})
+
+# Run status polling starts fast for short runs and backs off to this cap, in seconds
+_POLL_INITIAL_DELAY = 0.5
+_POLL_BACKOFF = 1.5
+_POLL_MAX_DELAY = 5.0
+
+# Largest page Apify returns from a single dataset items request
+_DATASET_PAGE_SIZE = 1000
+
+# Dataset pages fetched concurrently when a limit spans several pages
+_PAGE_WORKERS = 4
+
+# Fast path for the usual https://www.tiktok.com/@username[/...] profile URL
+_TT_RE = re.compile(r'tiktok\.com/@([A-Za-z0-9._]+)')
+
 class TikTokProfileScraper:
     """Uses Apify to scrape video URLs from a TikTok profile."""
 
@@ -24,7 +55,7 @@ class TikTokProfileScraper:
 
         Args:
             api_key: Your Apify API token.
-            logger: Logger instance (creates new one if None).
+            logger: Logger instance (uses the shared module logger if None).
         
         Raises:
             TikTokTranscriberError: If the API key is not provided.
@@ -32,27 +63,14 @@ class TikTokProfileScraper:
         if not api_key:
             raise TikTokTranscriberError("An Apify API key is required for profile scraping.")
             
-        self.logger = logger or self._setup_logger()
+        self.logger = logger or _MODULE_LOGGER
         try:
             self.client = ApifyClient(api_key)
+            # Actor handles are reused for every scrape instead of rebuilt per call
+            self._actor = self.client.actor(_ACTOR_ID)
         except Exception as e:
             raise TikTokTranscriberError(f"Failed to initialize Apify client: {e}")
 
-    def _setup_logger(self) -> logging.Logger:
-        """Set up logging configuration."""
-        logger = logging.getLogger(f"{__name__}.TikTokProfileScraper")
-        logger.setLevel(logging.INFO)
-        
-        if not logger.handlers:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
-        
-        return logger
-
     def _extract_username(self, profile_url: str) -> str:
         """
         Extracts the username from a TikTok profile URL.
@@ -66,6 +84,10 @@ class TikTokProfileScraper:
         Raises:
             TikTokTranscriberError: If the username cannot be extracted.
         """
+        match = _TT_RE.search(profile_url)
+        if match:
+            return match.group(1)
+
         try:
             # Valid URLs: https://www.tiktok.com/@username
             path_segments = urlparse(profile_url).path.strip('/').split('/')
@@ -73,9 +95,17 @@ class TikTokProfileScraper:
                 return path_segments[0][1:]
             raise ValueError("Path does not contain a valid @username format.")
         except Exception as e:
-            self.logger.error(f"Could not extract username from URL '{profile_url}': {e}")
+            self.logger.error("Could not extract username from URL '%s': %s", profile_url, e)
             raise TikTokTranscriberError(f"Invalid TikTok profile URL format: {profile_url}")
 
+    def _run_input(self, username: str, video_limit: int) -> dict:
+        """Build the Actor input for scraping one profile."""
+        return {
+            "profiles": [username],
+            "resultsPerPage": video_limit,
+            "shouldDownloadVideos": False,  # We only need the URLs, saving time and resources
+        }
+
     def scrape_profile_videos(self, username: str, video_limit: int = 5) -> List[str]:
         """
         Runs the Apify TikTok Profile Scraper Actor to get video URLs.
@@ -90,36 +120,93 @@ class TikTokProfileScraper:
         Raises:
             TikTokTranscriberError: If the scraping process fails.
         """
-        self.logger.info(f"Starting scrape for TikTok profile: {username} (limit: {video_limit})")
+        self.logger.info("Starting scrape for TikTok profile: %s (limit: %d)", username, video_limit)
 
-        run_input = {
-            "profiles": [username],
-            "resultsPerPage": video_limit,
-            "shouldDownloadVideos": False,  # We only need the URLs, saving time and resources
-        }
+        run_input = self._run_input(username, video_limit)
         
         try:
             # Run the Actor and wait for it to finish
-            self.logger.info("Calling Apify Actor 'clockworks/tiktok-profile-scraper'...")
-            actor_run = self.client.actor("clockworks/tiktok-profile-scraper").call(run_input=run_input)
+            self.logger.info("Calling Apify Actor '%s'...", _ACTOR_ID)
+            actor_run = self._run_actor(run_input)
             
-            self.logger.info(f"Apify Actor run finished. Dataset ID: {actor_run['defaultDatasetId']}")
+            self.logger.info("Apify Actor run finished. Dataset ID: %s", actor_run['defaultDatasetId'])
             
-            video_urls = []
-            dataset = self.client.dataset(actor_run['defaultDatasetId'])
-
-            # Extract video URLs
-            for video_data in dataset.iterate_items():
-                if 'webVideoUrl' in video_data and video_data["webVideoUrl"]:
-                    video_urls.append(video_data["webVideoUrl"])
+            video_urls = self._fetch_video_urls(actor_run['defaultDatasetId'], video_limit)
               
             if not video_urls:
-                 self.logger.warning(f"No video URLs found for profile '{username}'. The profile might be private or have no videos.")
+                 self.logger.warning("No video URLs found for profile '%s'. The profile might be private or have no videos.", username)
 
-            self.logger.info(f"Successfully scraped {len(video_urls)} video URLs.")
+            self.logger.info("Successfully scraped %d video URLs.", len(video_urls))
 
             return video_urls
 
         except Exception as e:
-            self.logger.error(f"Apify Actor call failed: {e}")
-            raise TikTokTranscriberError(f"Failed to scrape profile '{username}': {e}")
\ No newline at end of file
+            self.logger.error("Apify Actor call failed: %s", e)
+            raise TikTokTranscriberError(f"Failed to scrape profile '{username}': {e}")
+
+    def _run_actor(self, run_input: dict) -> dict:
+        """
+        Starts an Actor run and polls it with exponential backoff until it finishes.
+
+        Returns:
+            The finished run's details.
+
+        Raises:
+            TikTokTranscriberError: If the run ends in any status but SUCCEEDED.
+        """
+        actor_run = self._actor.start(run_input=run_input)
+        run_client = self.client.run(actor_run['id'])
+        delay = _POLL_INITIAL_DELAY
+        # get() returns None if the run vanished; _check_run reports that
+        while actor_run is not None and actor_run['status'] not in _TERMINAL_STATUSES:
+            time.sleep(delay)
+            actor_run = run_client.get()
+            delay = min(delay * _POLL_BACKOFF, _POLL_MAX_DELAY)
+        return self._check_run(actor_run)
+
+    def _check_run(self, actor_run: Optional[dict]) -> dict:
+        """Return a finished run, raising if it did not succeed."""
+        if not actor_run:
+            raise TikTokTranscriberError("Apify Actor run disappeared while polling")
+        if actor_run['status'] != "SUCCEEDED":
+            raise TikTokTranscriberError(f"Apify Actor run {actor_run['id']} ended with status {actor_run['status']}")
+        return actor_run
+
+    def _fetch_video_urls(self, dataset_id: str, video_limit: int) -> List[str]:
+        """
+        Reads up to video_limit video URLs from a dataset.
+
+        Only the webVideoUrl field is requested, one bounded page at a time,
+        stopping as soon as enough URLs are collected or the dataset runs out.
+        Limits spanning several pages fetch those pages concurrently on disjoint
+        offset ranges first.
+        """
+        dataset = self.client.dataset(dataset_id)
+        video_urls: List[str] = []
+        offset = 0
+        exhausted = False
+
+        if video_limit > _DATASET_PAGE_SIZE:
+            page_limits = [(page_offset, min(_DATASET_PAGE_SIZE, video_limit - page_offset))
+                           for page_offset in range(0, video_limit, _DATASET_PAGE_SIZE)]
+            with ThreadPoolExecutor(max_workers=min(_PAGE_WORKERS, len(page_limits))) as executor:
+                pages = list(executor.map(lambda page: self._list_page(dataset, *page), page_limits))
+            for (_, page_limit), items in zip(page_limits, pages):
+                video_urls.extend(video_data['webVideoUrl'] for video_data in items if video_data.get('webVideoUrl'))
+                offset += len(items)
+                if len(items) < page_limit:
+                    exhausted = True
+                    break
+
+        # Top up sequentially if some items had no URL
+        while not exhausted and len(video_urls) < video_limit:
+            items = self._list_page(dataset, offset, min(video_limit - len(video_urls), _DATASET_PAGE_SIZE))
+            if not items:
+                break
+            video_urls.extend(video_data['webVideoUrl'] for video_data in items if video_data.get('webVideoUrl'))
+            offset += len(items)
+        return video_urls[:video_limit]
+
+    def _list_page(self, dataset: Any, offset: int, limit: int) -> List[dict]:
+        """Fetch one page of webVideoUrl-only items from a dataset client."""
+        return dataset.list_items(offset=offset, limit=limit, fields='webVideoUrl', clean=True).items
@@ -1,11 +1,23 @@
 import re
 
+try:
+    from selectolax.parser import HTMLParser
+except ImportError:  # Fall back to the regex extractor below
+    HTMLParser = None
+
+_SCRIPT_RE = re.compile(r'<script[^>]*>(.*?)</script>', re.DOTALL | re.IGNORECASE)
+
 def extract_script_contents(html: str) -> str:
     """
     Extracts the content of the first <script>...</script> tag from the input string.
     If no script tags are found, returns the original string.
+    Uses selectolax's C HTML parser when installed, otherwise a regex.
     """
-    match = re.search(r'<script[^>]*>(.*?)</script>', html, re.DOTALL | re.IGNORECASE)
+    if HTMLParser is not None:
+        node = HTMLParser(html).css_first('script')
+        return node.text().strip() if node is not None else html
+
+    match = _SCRIPT_RE.search(html)
     if match:
         return match.group(1).strip()
     return html
\ No newline at end of file
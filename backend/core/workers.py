@@ -1,49 +1,382 @@
 import os
-import sys
-import logging
-import argparse
-from typing import Optional, Tuple, Dict
+import queue
+import atexit
+import tempfile
+import threading
+import contextlib
+import multiprocessing as mp
+from typing import Optional, Tuple, Dict, List, Iterator, TYPE_CHECKING
 import concurrent.futures
 
 # Import custom classes from other modules
-from .tiktok_downloader import TikTokDownloader, TikTokTranscriberError
-from .audio_transcriber import AudioTranscriber
-from .tiktok_profile_scraper import TikTokProfileScraper
-from .gemini_client import GeminiClient
-from .secret import APIFY_API_KEY, GEMINI_API_KEY
-from .tiktok_audio_processor import TikTokAudioProcessor
-
-def process_video_worker(
-    url: str, 
-    model_name: str, 
-    output_dir: Optional[str], 
-    keep_audio: bool, 
+from .tiktok_downloader import TikTokDownloader
+from .cache import (get_cached, set_cached, transcription_key, TRANSCRIPTION_TTL,
+                    load_transcript, store_transcript)
+
+# The processor pulls in torch and Whisper, so it is only imported inside the
+# workers that use it; importing this module (e.g. from tasks.py) stays cheap
+if TYPE_CHECKING:
+    from .tiktok_audio_processor import TikTokAudioProcessor
+
+# Processors (and Whisper models) owned by each worker process, keyed by
+# (model_name, backend, compute_type) so a call for another configuration
+# never reuses a model loaded for a different one
+_WORKER_PROCESSORS: Dict[Tuple[str, str, Optional[str]], "TikTokAudioProcessor"] = {}
+
+# Transcription executors reused across pipeline runs (and so across Celery
+# tasks), keyed by (model_name, compute_type, backend) and storing
+# (executor, max_workers), so worker processes keep their loaded models
+_TRANSCRIPTION_POOLS: Dict[Tuple[str, Optional[str], str], Tuple[concurrent.futures.Executor, int]] = {}
+_TRANSCRIPTION_POOLS_LOCK = threading.Lock()
+
+# Approximate resident memory of one worker process per Whisper model, in GB,
+# used to keep the transcription pool from exhausting RAM
+_MODEL_RSS_GB = {
+    "tiny": 1, "base": 1, "small": 2, "medium": 5,
+    "large": 10, "large-v1": 10, "large-v2": 10, "large-v3": 10,
+    "large-v3-turbo": 6, "distil-large-v3": 5,
+}
+
+def _model_concurrency(model_name: str) -> int:
+    """Return how many workers can usefully run a Whisper model at once on this machine."""
+    cpu_count = os.cpu_count() or 1
+    if model_name in ("tiny", "base"):
+        return cpu_count
+    if model_name == "small":
+        return max(cpu_count // 2, 1)
+    if model_name == "medium":
+        return 2
+    return 1
+
+def default_max_workers(num_urls: int, model_name: str) -> int:
+    """
+    Size the transcription pool for a batch of URLs and a Whisper model.
+
+    The pool never exceeds the number of URLs, the CPU count or the model's
+    concurrency limit, and, when psutil is installed, is further capped so
+    every worker's model fits in the currently available memory.
+    """
+    max_workers = min(num_urls, os.cpu_count() or 1, _model_concurrency(model_name))
+    try:
+        import psutil
+    except ImportError:
+        return max(max_workers, 1)
+
+    available_gb = psutil.virtual_memory().available / 1024 ** 3
+    fits_in_memory = int(available_gb // _MODEL_RSS_GB.get(model_name, 10))
+    return max(min(max_workers, fits_in_memory), 1)
+
+def _core_groups(num_workers: int) -> List[List[int]]:
+    """Split the CPUs available to this process into one disjoint group per worker."""
+    if hasattr(os, "sched_getaffinity"):
+        cores = sorted(os.sched_getaffinity(0))
+    else:
+        cores = list(range(os.cpu_count() or 1))
+    num_workers = max(min(num_workers, len(cores)), 1)
+    size = len(cores) // num_workers
+    return [cores[i * size:(i + 1) * size] for i in range(num_workers)]
+
+def _pin_worker(cores: List[int]) -> None:
+    """
+    Pin this worker process to its own group of cores and size the BLAS and
+    torch thread pools to match, so parallel workers do not each spawn a
+    thread per core and contend for the same CPUs.
+    """
+    for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS"):
+        os.environ[var] = str(len(cores))
+    try:
+        import psutil
+        psutil.Process().cpu_affinity(cores)
+    except (ImportError, AttributeError, NotImplementedError):
+        # Without psutil, or on platforms with no affinity API (macOS), pin
+        # through the OS where possible and otherwise only size the thread pools
+        if hasattr(os, "sched_setaffinity"):
+            os.sched_setaffinity(0, cores)
+
+    import torch
+    torch.set_num_threads(len(cores))
+
+def init_worker(model_name: str, device: Optional[str] = None,
+                core_groups: Optional["mp.Queue"] = None,
+                compute_type: Optional[str] = None, backend: str = "faster_whisper") -> None:
+    """
+    Process pool initializer that builds one TikTokAudioProcessor per worker,
+    so the Whisper model is loaded once and reused for every URL it handles.
+    When core_groups is given, the worker first takes one group of cores from
+    that queue and pins itself to it.
+    """
+    if core_groups is not None:
+        try:
+            _pin_worker(core_groups.get(timeout=5))
+        except queue.Empty:
+            pass
+
+    from .tiktok_audio_processor import TikTokAudioProcessor
+    
+    _WORKER_PROCESSORS[(model_name, backend, compute_type)] = TikTokAudioProcessor(
+        model_name=model_name, device=device, backend=backend, compute_type=compute_type
+    )
+
+def _get_worker_processor(model_name: str, compute_type: Optional[str] = None,
+                          backend: str = "faster_whisper") -> "TikTokAudioProcessor":
+    """Return this process's processor for the configuration, creating it if no initializer did."""
+    key = (model_name, backend, compute_type)
+    processor = _WORKER_PROCESSORS.get(key)
+    if processor is None:
+        from .tiktok_audio_processor import TikTokAudioProcessor
+        processor = _WORKER_PROCESSORS[key] = TikTokAudioProcessor(
+            model_name=model_name, backend=backend, compute_type=compute_type
+        )
+    return processor
+
+def _cached_transcription(url: str, model_name: str) -> Optional[Dict]:
+    """Look up a finished transcription in Redis, then in the on-disk cache."""
+    return get_cached(transcription_key(url, model_name)) or load_transcript(url, model_name)
+
+def _cache_transcription(url: str, model_name: str, transcription: Dict) -> None:
+    """Store a finished transcription in both Redis and the on-disk cache."""
+    set_cached(transcription_key(url, model_name), transcription, TRANSCRIPTION_TTL)
+    store_transcript(url, model_name, transcription)
+
+def transcribe_audio_worker(
+    url: str,
+    audio_path: str,
+    model_name: str,
+    keep_audio: bool,
     language: Optional[str],
-    filename: Optional[str] = None
+    backend: str = "faster_whisper",
+    compute_type: Optional[str] = None
 ) -> Dict:
     """
-    Worker function to be executed by each process.
-    Initializes its own processor and handles one URL.
+    Worker function for the transcription stage of process_videos_pipelined.
+    Transcribes an already downloaded audio file.
     """
-    # Each worker process creates its own instance of the processor.
-    # This correctly handles model loading and other resources per-process.
-    processor = TikTokAudioProcessor(model_name=model_name)
-    
+    processor = _get_worker_processor(model_name, compute_type, backend)
+
     try:
-        result = processor.process_url(
-            url, 
-            output_dir, 
-            keep_audio, 
-            language,
-            filename=filename
-        )
-        # Include the original URL in the result for tracking
+        result = processor.transcribe_only(audio_path, language=language, keep_audio=keep_audio)
         result['original_url'] = url
+        if result.get('transcription'):
+            _cache_transcription(url, model_name, result['transcription'])
         return result
     except Exception as e:
-        # Return a dictionary with error information
         return {
             'original_url': url,
             'error': str(e),
             'transcription': None
         }
+
+def transcribe_audio_batch_worker(
+    urls: List[str],
+    audio_paths: List[str],
+    model_name: str,
+    keep_audio: bool,
+    language: Optional[str],
+    backend: str = "faster_whisper",
+    compute_type: Optional[str] = None
+) -> List[Dict]:
+    """
+    Worker function for the batched transcription stage of process_videos_pipelined.
+    Transcribes several downloaded audio files in one batched Whisper call.
+    """
+    processor = _get_worker_processor(model_name, compute_type, backend)
+
+    try:
+        results = processor.transcribe_batch_only(audio_paths, language=language, keep_audio=keep_audio)
+    except Exception as e:
+        return [{'original_url': url, 'error': str(e), 'transcription': None} for url in urls]
+
+    for url, result in zip(urls, results):
+        result['original_url'] = url
+        if result.get('transcription'):
+            _cache_transcription(url, model_name, result['transcription'])
+    return results
+
+def _cuda_available() -> bool:
+    """Check for a CUDA device, importing torch only when it is needed."""
+    import torch
+    return torch.cuda.is_available()
+
+def _transcription_pool(model_name: str, max_workers: Optional[int], compute_type: Optional[str] = None,
+                        backend: str = "faster_whisper") -> concurrent.futures.Executor:
+    """
+    Return the executor for the transcription stage, creating it on first use.
+
+    The executor outlives the pipeline run that created it and is reused by
+    later runs with the same model, so pool workers load their model once
+    rather than once per run. It is only replaced when a run asks for more
+    workers than it has, or after a worker died and broke it.
+    """
+    key = (model_name, compute_type, backend)
+    num_workers = max_workers or default_max_workers(os.cpu_count() or 1, model_name)
+    with _TRANSCRIPTION_POOLS_LOCK:
+        pool, pool_workers = _TRANSCRIPTION_POOLS.get(key, (None, 0))
+        # Executors set _broken once a worker dies, after which they reject all work
+        if pool is not None and pool_workers >= num_workers and not getattr(pool, "_broken", False):
+            return pool
+        if pool is not None:
+            pool.shutdown(wait=False)
+        pool = _new_transcription_pool(model_name, num_workers, compute_type, backend)
+        _TRANSCRIPTION_POOLS[key] = (pool, num_workers)
+        return pool
+
+def _new_transcription_pool(model_name: str, num_workers: int, compute_type: Optional[str],
+                            backend: str) -> concurrent.futures.Executor:
+    """
+    Create an executor for the transcription stage.
+
+    On GPU a thread pool shares the single processor loaded in this process,
+    instead of forking one model copy per process into VRAM. The process
+    pool, with one model per worker, is only used on CPU, where each worker
+    is pinned to its own share of the cores.
+
+    Workers are started with spawn rather than fork: a CTranslate2 model
+    loaded in this process owns worker threads that do not survive a fork,
+    and an inherited model would keep a thread count sized for every core.
+    Each worker instead loads its own model in init_worker after pinning.
+    """
+    if _cuda_available():
+        # More threads than the model can run at once would only queue on it
+        concurrency = _get_worker_processor(model_name, compute_type, backend).transcriber.concurrency()
+        return concurrent.futures.ThreadPoolExecutor(max_workers=min(num_workers, concurrency))
+    context = mp.get_context("spawn")
+    # Each worker takes its group from the queue, so no two share cores whatever
+    # order they start in
+    core_groups = context.Queue()
+    groups = _core_groups(num_workers)
+    for i in range(num_workers):
+        core_groups.put(groups[i % len(groups)])
+    return concurrent.futures.ProcessPoolExecutor(
+        max_workers=num_workers, mp_context=context, initializer=init_worker,
+        initargs=(model_name, None, core_groups, compute_type, backend)
+    )
+
+@atexit.register
+def _shutdown_transcription_pools() -> None:
+    """Stop the persistent transcription executors when the interpreter exits."""
+    with _TRANSCRIPTION_POOLS_LOCK:
+        for pool, _ in _TRANSCRIPTION_POOLS.values():
+            pool.shutdown(wait=False, cancel_futures=True)
+        _TRANSCRIPTION_POOLS.clear()
+
+@contextlib.contextmanager
+def _download_dir(output_dir: Optional[str], keep_audio: bool) -> Iterator[Optional[str]]:
+    """
+    Yield the directory downloads go to. When no directory is given and the audio
+    is not kept, this is a temporary directory removed in one go on exit, which
+    also catches files a failed transcription left behind.
+    """
+    if output_dir is not None or keep_audio:
+        yield output_dir
+        return
+    with tempfile.TemporaryDirectory(prefix="scripttok-") as tmp_dir:
+        yield tmp_dir
+
+def process_videos_pipelined(
+    urls: List[str],
+    model_name: str,
+    output_dir: Optional[str],
+    keep_audio: bool,
+    language: Optional[str],
+    filenames: Optional[List[Optional[str]]] = None,
+    max_workers: Optional[int] = None,
+    max_downloads: int = 8,
+    batch_size: int = 8,
+    compute_type: Optional[str] = None,
+    use_cache: bool = True,
+    backend: str = "faster_whisper"
+) -> Iterator[Tuple[str, Dict]]:
+    """
+    Download and transcribe videos as a two-stage pipeline.
+
+    Downloads are network-bound and run on a thread pool in this process;
+    each finished download is immediately handed to the persistent
+    transcription pool (see _transcription_pool), so downloads and transcriptions overlap across URLs. URLs
+    with a transcription in Redis or the disk cache are yielded straight away and
+    never downloaded, unless use_cache is False.
+
+    On GPU with the openai-whisper or faster-whisper backend, finished
+    downloads are grouped into batches of up to batch_size clips for
+    AudioTranscriber.transcribe_batch: openai-whisper decodes the clips' mel
+    spectrograms in one forward pass, and faster-whisper decodes each clip's
+    speech chunks in batches. Other backends transcribe each URL as soon as
+    its download finishes.
+
+    Yields:
+        (url, result) tuples as each video finishes, in completion order
+    """
+    if not urls:
+        return
+    if filenames is None:
+        filenames = [None] * len(urls)
+
+    pending = []
+    for url, filename in zip(urls, filenames):
+        cached = None
+        if use_cache:
+            cached = _cached_transcription(url, model_name)
+        if cached is not None:
+            yield url, {'original_url': url, 'audio_file': None, 'transcription': cached}
+        else:
+            pending.append((url, filename))
+    if not pending:
+        return
+
+    if max_workers is None:
+        max_workers = default_max_workers(len(pending), model_name)
+
+    downloader = TikTokDownloader()
+    # Not shut down here: the transcription pool and its loaded models are reused by later runs
+    transcribe_pool = _transcription_pool(model_name, max_workers, compute_type, backend)
+    with _download_dir(output_dir, keep_audio) as output_dir, \
+            concurrent.futures.ThreadPoolExecutor(max_workers=min(max_downloads, len(pending))) as download_pool:
+        download_futures = {
+            download_pool.submit(downloader.download_audio, url, output_dir=output_dir, filename=filename): url
+            for url, filename in pending
+        }
+
+        batched = _cuda_available() and \
+            _get_worker_processor(model_name, compute_type, backend).transcriber.backend in ("whisper", "faster_whisper")
+
+        # Values are a single URL, or the list of URLs of a batch
+        transcribe_futures = {}
+        ready: List[Tuple[str, str]] = []
+        downloading = set(download_futures)
+        # Wait on both stages together, so a finished transcription is yielded
+        # right away instead of after the last download
+        while downloading or transcribe_futures:
+            done, _ = concurrent.futures.wait(
+                downloading | transcribe_futures.keys(), return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                if future in transcribe_futures:
+                    urls_done = transcribe_futures.pop(future)
+                    if isinstance(urls_done, list):
+                        yield from zip(urls_done, future.result())
+                    else:
+                        yield urls_done, future.result()
+                    continue
+
+                downloading.discard(future)
+                url = download_futures[future]
+                try:
+                    audio_path = future.result()
+                except Exception as e:
+                    yield url, {'original_url': url, 'error': str(e), 'transcription': None}
+                    continue
+
+                if batched:
+                    ready.append((url, audio_path))
+                else:
+                    transcribe_futures[transcribe_pool.submit(
+                        transcribe_audio_worker, url, audio_path, model_name, keep_audio, language,
+                        backend, compute_type
+                    )] = url
+
+            if ready and (len(ready) >= batch_size or not downloading):
+                batch_urls, batch_paths = map(list, zip(*ready))
+                transcribe_futures[transcribe_pool.submit(
+                    transcribe_audio_batch_worker, batch_urls, batch_paths, model_name, keep_audio, language,
+                    backend, compute_type
+                )] = batch_urls
+                ready = []
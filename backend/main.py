@@ -8,89 +8,29 @@ This script orchestrates the process of downloading audio from a TikTok URL
 or an entire profile, and transcribing it using OpenAI Whisper.
 """
 
-import os
+import io
 import sys
+import json
+import asyncio
 import logging
 import argparse
-from typing import Optional, Tuple, Dict
-import concurrent.futures
+import functools
+from typing import TYPE_CHECKING
 
 # Import custom classes from other modules
-from core.tiktok_downloader import TikTokDownloader, TikTokTranscriberError
-from core.audio_transcriber import AudioTranscriber
-from core.tiktok_profile_scraper import TikTokProfileScraper
-from core.gemini_client import GeminiClient
+from core.tiktok_downloader import TikTokTranscriberError
+from core.gemini_client import get_gemini_client
 from core.secret import APIFY_API_KEY, GEMINI_API_KEY
+from core.workers import process_videos_pipelined, default_max_workers
 
+# The processor imports torch and Whisper; only --serve needs it in this process,
+# the default pipeline builds it inside its worker processes
+if TYPE_CHECKING:
+    from core.tiktok_audio_processor import TikTokAudioProcessor
 
-class TikTokAudioProcessor:
-    """Main orchestrator class that combines downloading and transcription."""
-    
-    def __init__(self, model_name: str = "small", device: Optional[str] = None):
-        """
-        Initialize the TikTok audio processor.
-        
-        Args:
-            model_name: Whisper model to use for transcription
-            device: Device to run model on (auto-detected if None)
-        """
-        self.logger = self._setup_logger()
-        self.downloader = TikTokDownloader(logger=self.logger)
-        self.transcriber = AudioTranscriber(model_name, device, logger=self.logger)
-    
-    def _setup_logger(self) -> logging.Logger:
-        """Set up logging configuration."""
-        logger = logging.getLogger(__name__)
-        logger.setLevel(logging.INFO)
-        
-        if not logger.handlers:
-            handler = logging.StreamHandler()
-            formatter = logging.Formatter(
-                '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-            )
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
-        
-        return logger
-    
-    def process_url(self, url: str, output_dir: Optional[str] = None, 
-                    keep_audio: bool = False, language: Optional[str] = None,
-                    filename: Optional[str] = None) -> dict:
-        """
-        Complete pipeline: download audio from TikTok URL and transcribe.
-        
-        Args:
-            url: TikTok URL to process
-            output_dir: Directory for audio files
-            keep_audio: Whether to keep the downloaded audio file
-            language: Language code for transcription
-            filename: Custom filename for audio file
-            
-        Returns:
-            Dictionary containing transcription results and metadata
-        """
-        audio_path = None
-        try:
-            audio_path = self.downloader.download_audio(
-                url, output_dir=output_dir, filename=filename
-            )
-            transcription_result = self.transcriber.transcribe(audio_path, language=language)
-            
-            return {
-                'transcription': transcription_result,
-                'audio_file': audio_path if keep_audio else None,
-            }
-        finally:
-            if audio_path and not keep_audio and os.path.exists(audio_path):
-                try:
-                    os.remove(audio_path)
-                    self.logger.info(f"Cleaned up audio file: {audio_path}")
-                except Exception as e:
-                    self.logger.warning(f"Failed to clean up audio file: {e}")
 
 def get_profile_name_from_user() -> str:
     """Get TikTok username from user input with validation."""
-    downloader = TikTokDownloader()
     while True:
         url = input("Please enter a TikTok username to base style off of: @").strip()
         if url:
@@ -113,68 +53,48 @@ def display_results(result: dict) -> None:
     transcription = result['transcription']
     # video_info = result['video_info']
     
-    print("\n" + "="*60)
-    print("VIDEO INFORMATION")
-    print("="*60)
-    # print(f"Title: {video_info['title']}")
-    # print(f"Uploader: {video_info['uploader']}")
-    # print(f"Duration: {video_info['duration']:.1f} seconds")
-    
-    print("\n" + "="*60)
-    print("TRANSCRIPTION RESULTS")
-    print("="*60)
-    print(f"Text: {transcription['text']}")
-    print(f"Language: {transcription.get('language', 'Unknown')}")
+    # Build the whole report and write it once instead of one print per line
+    rule = "=" * 60
+    lines = [
+        "", rule, "VIDEO INFORMATION", rule,
+        # f"Title: {video_info['title']}",
+        # f"Uploader: {video_info['uploader']}",
+        # f"Duration: {video_info['duration']:.1f} seconds",
+        "", rule, "TRANSCRIPTION RESULTS", rule,
+        f"Text: {transcription['text']}",
+        f"Language: {transcription.get('language', 'Unknown')}",
+    ]
     
-    if 'segments' in transcription and transcription['segments']:
-        print("\n" + "-"*40)
-        print("DETAILED SEGMENTS:")
-        print("-"*40)
-        for i, seg in enumerate(transcription['segments'], 1):
-            print(f"{i:2d}. [{seg['start']:6.2f}s - {seg['end']:6.2f}s] {seg['text'].strip()}")
+    if transcription.get('segments'):
+        lines += ["", "-" * 40, "DETAILED SEGMENTS:", "-" * 40]
+        lines += [
+            f"{i:2d}. [{seg['start']:6.2f}s - {seg['end']:6.2f}s] {seg['text'].strip()}"
+            for i, seg in enumerate(transcription['segments'], 1)
+        ]
     
     if result['audio_file']:
-        print(f"\nAudio file saved: {result['audio_file']}")
-    print("="*60)
-
-
-def process_video_worker(
-    url: str, 
-    model_name: str, 
-    output_dir: Optional[str], 
-    keep_audio: bool, 
-    language: Optional[str],
-    filename: Optional[str] = None
-) -> Dict:
-    """
-    Worker function to be executed by each process.
-    Initializes its own processor and handles one URL.
+        lines.append(f"\nAudio file saved: {result['audio_file']}")
+    lines.append(rule)
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
+def serve(processor: "TikTokAudioProcessor", args: argparse.Namespace) -> None:
     """
-    # Each worker process creates its own instance of the processor.
-    # This correctly handles model loading and other resources per-process.
-    processor = TikTokAudioProcessor(model_name=model_name)
+    Keep one processor loaded and transcribe URLs read from stdin, one per line.
     
-    try:
-        result = processor.process_url(
-            url, 
-            output_dir, 
-            keep_audio, 
-            language,
-            filename=filename
-        )
-        # Include the original URL in the result for tracking
-        result['original_url'] = url
-        return result
-    except Exception as e:
-        # Return a dictionary with error information
-        return {
-            'original_url': url,
-            'error': str(e),
-            'transcription': None
-        }
-
-def main():
-    """Main function to run the TikTok transcriber."""
+    Each result is written to stdout as a single JSON line, so repeated runs
+    avoid reloading the Whisper model every time. The next URL is downloaded
+    while the current one is being transcribed.
+    """
+    print("Ready. Enter one TikTok URL per line (Ctrl-D to quit).", file=sys.stderr)
+    for result in processor.process_stream(sys.stdin, output_dir=args.output_dir, keep_audio=args.keep_audio,
+                                           language=args.language, use_cache=not args.no_cache):
+        print(json.dumps(result, default=float), flush=True)
+
+
+@functools.cache
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser once; later calls reuse it."""
     parser = argparse.ArgumentParser(
         description="Transcribe audio from TikTok videos or profiles.",
         formatter_class=argparse.RawTextHelpFormatter,
@@ -185,6 +105,9 @@ Examples:
 
   - Scrape and transcribe 5 videos from a profile:
     python main.py --profile-url "https://www.tiktok.com/@apifyoffice" --apify-token "YOUR_API_TOKEN" --limit 5 --keep-audio
+
+  - Keep the model loaded and transcribe URLs piped on stdin:
+    python main.py --serve < urls.txt
 """
     )
     
@@ -195,13 +118,35 @@ Examples:
     parser.add_argument("--topic", help="The topic idea to generate a new script around.")
     parser.add_argument("--apify-token", default=APIFY_API_KEY, help="Your Apify API token (required for --profile-url).")
     parser.add_argument("--limit", type=int, default=3, help="Number of videos to process from a profile (default: 3).")
-    parser.add_argument("--model", default="tiny", choices=["tiny", "base", "small", "medium", "large", "large-v3"], help="Whisper model (default: tiny).")
+    parser.add_argument("--model", default="large-v3-turbo",
+                        choices=["tiny", "base", "small", "medium", "large", "large-v3", "large-v3-turbo", "distil-large-v3"],
+                        help="Whisper model (default: large-v3-turbo).")
+    parser.add_argument("--backend", default="faster_whisper",
+                        choices=["faster_whisper", "whisper", "whisper_trt", "whisper_cpp", "onnx", "openvino", "transformers"],
+                        help="Inference backend (default: faster_whisper).")
+    parser.add_argument("--compute-type", help="faster-whisper compute type, e.g. int8, int8_float16, float16\n(default: int8 on CPU, float16 on CUDA).")
     parser.add_argument("--output-dir", help="Directory to save audio files (defaults to a temporary folder).")
-    parser.add_argument("--keep-audio", default="n", action="store_true", help="Keep downloaded audio file(s).")
+    parser.add_argument("--keep-audio", action="store_true", help="Keep downloaded audio file(s).")
     parser.add_argument("--language", default="en", help="Language code for transcription (e.g., 'en', 'es').")
     parser.add_argument("--filename", help="Custom filename for audio (only in single URL mode).")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore cached transcriptions and re-process every video.")
+    parser.add_argument("--serve", action="store_true", help="Keep the model loaded and transcribe URLs read from stdin.")
     parser.add_argument("-v", "--verbose", action="store_true", help="Enable verbose logging.")
-    
+    return parser
+
+
+@functools.cache
+def _configure_logging(verbose: bool) -> None:
+    """Configure root logging once per process, however often main() runs."""
+    logging.basicConfig(level=logging.DEBUG if verbose else logging.INFO,
+                        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    # Suppress loud loggers
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+
+async def main():
+    """Main function to run the TikTok transcriber."""
+    parser = _build_parser()
     args = parser.parse_args()
 
     if args.profile_name and not args.apify_token:
@@ -209,13 +154,27 @@ Examples:
     if args.filename and args.profile_name:
         print("Warning: --filename is ignored in profile mode.", file=sys.stderr)
 
-    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO,
-                        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-    # Suppress loud loggers
-    logging.getLogger("httpx").setLevel(logging.WARNING)
+    _configure_logging(args.verbose)
 
+    if args.model == "large":
+        print("Warning: 'large' is about twice as slow as 'large-v3-turbo' for similar accuracy.", file=sys.stderr)
+
+    if args.serve:
+        from core.tiktok_audio_processor import TikTokAudioProcessor
+        try:
+            serve(TikTokAudioProcessor(model_name=args.model, backend=args.backend,
+                                       compute_type=args.compute_type), args)
+        except KeyboardInterrupt:
+            pass
+        return
 
     try:
+        # Set up the Gemini client and load the system prompt up front, so it
+        # overlaps with scraping, the topic prompt and video processing
+        gemini_task = asyncio.create_task(
+            asyncio.to_thread(get_gemini_client, GEMINI_API_KEY, "system_prompt.txt")
+        )
+
         # urls_to_process = []
     
         # profile_name = args.profile_name if args.profile_name else get_profile_name_from_user()
@@ -231,72 +190,74 @@ Examples:
         if args.topic:
             new_topic_idea = args.topic
         else:
-            new_topic_idea = get_topic_from_user()
+            # Prompt on a worker thread; a blocking input() here would stall the
+            # event loop and keep the Gemini setup task from starting
+            new_topic_idea = await asyncio.to_thread(get_topic_from_user)
 
         # print(f"\nFound {len(urls_to_process)} video(s) to process.")
 
-        past_scripts_data = []
+        # Transcripts are written into the prompt as each video completes
+        prompt_buffer = io.StringIO()
+        seen_scripts = set()
         urls_to_process = [
             "https://www.tiktok.com/@3blue1brown/video/7499089278320921886",
             "https://www.tiktok.com/@3blue1brown/video/7495374287524613406",
             "https://www.tiktok.com/@3blue1brown/video/7490602042063392030",
                      ]
-        max_workers = os.cpu_count()
+        max_workers = default_max_workers(len(urls_to_process), args.model)
         print(f"Starting processing with up to {max_workers} parallel workers...")
-        output_dir = "output"
+        # Without --output-dir, unkept audio goes to a temporary directory the pipeline removes
+        output_dir = args.output_dir or ("output" if args.keep_audio else None)
         keep_audio = args.keep_audio
         language = args.language
         profile_name = args.profile_name
-        # Use the ProcessPoolExecutor to manage parallel execution
-        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
-            
-            # Submit all jobs to the executor. 
-            # executor.submit schedules the function to be executed and returns a Future object.
-            future_to_url = {
-                executor.submit(
-                    process_video_worker, 
-                    url, 
-                    args.model, 
-                    output_dir, 
-                    keep_audio, 
-                    language,
-                    # Pass a custom filename if needed
-                    filename=None if profile_name else f"video_{i}.mp3"
-                ): url 
-                for i, url in enumerate(urls_to_process)
-            }
-            
-            # Process results as they are completed
-            total_videos = len(urls_to_process)
-            for i, future in enumerate(concurrent.futures.as_completed(future_to_url), 1):
-                url = future_to_url[future]
-                print(f"\n{'#'*25} Completed Video {i}/{total_videos} ({url}) {'#'*25}")
-                
-                try:
-                    result = future.result() # Get the result from the worker
-                    
-                    if result.get('error'):
-                        print(f"An error occurred while processing {url}: {result['error']}")
-                        continue
-
-                    display_results(result) # Your function to show results
-                    
-                    transcription_result = result['transcription']['text'] # Assuming result['transcription'] is the Whisper dict
-                    formatted_script_block = f"[PAST_SCRIPT_{i}]:\n{transcription_result}"
-                    past_scripts_data.append(formatted_script_block)
-
-                except Exception as exc:
-                    print(f"An exception was generated for URL {url}: {exc}")
+        # Download on threads and transcribe in worker processes as downloads finish
+        total_videos = len(urls_to_process)
+        pipeline = process_videos_pipelined(
+            urls_to_process,
+            args.model,
+            output_dir,
+            keep_audio,
+            language,
+            # Pass a custom filename if needed
+            filenames=[None if profile_name else f"video_{i}.mp3" for i in range(total_videos)],
+            max_workers=max_workers,
+            compute_type=args.compute_type,
+            use_cache=not args.no_cache,
+            backend=args.backend
+        )
 
-        print("\nAll videos have been processed.")
+        # Process results as they are completed, pulling from the pipeline on a
+        # worker thread so the event loop stays free for the Gemini setup
+        i = 0
+        while (item := await asyncio.to_thread(next, pipeline, None)) is not None:
+            url, result = item
+            i += 1
+            print(f"\n{'#'*25} Completed Video {i}/{total_videos} ({url}) {'#'*25}")
 
-        final_scripts_string = "\n\n".join(past_scripts_data)
-        topic_string = f"[NEW_TOPIC]:\n{new_topic_idea}"
+            try:
+                if result.get('error'):
+                    print(f"An error occurred while processing {url}: {result['error']}")
+                    continue
+
+                display_results(result) # Your function to show results
+
+                # Only the text goes into the prompt; segments would just add noise
+                transcription_text = result['transcription']['text'].strip()
+                if transcription_text and transcription_text not in seen_scripts:
+                    seen_scripts.add(transcription_text)
+                    prompt_buffer.write(f"[PAST_SCRIPT_{len(seen_scripts)}]:\n{transcription_text}\n\n")
+
+            except Exception as exc:
+                print(f"An exception was generated for URL {url}: {exc}")
+
+        print("\nAll videos have been processed.")
 
-        user_input = f"{final_scripts_string}\n\n{topic_string}"
+        prompt_buffer.write(f"[NEW_TOPIC]:\n{new_topic_idea}")
+        user_input = prompt_buffer.getvalue()
 
-        geminiClient = GeminiClient(GEMINI_API_KEY, "system_prompt.txt")
-        resp = geminiClient.generate_text(user_input)
+        geminiClient = await gemini_task
+        resp = await geminiClient.generate_text_async(user_input)
         print(resp)
 
     except TikTokTranscriberError as e:
@@ -310,4 +271,4 @@ Examples:
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file
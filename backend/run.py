@@ -1,10 +1,23 @@
 # backend/run.py
+import orjson
 from flask import Flask
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
 from api.routes import api # Import the blueprint
 
+class OrjsonProvider(JSONProvider):
+    """JSON provider that serializes responses with orjson instead of the stdlib json module."""
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 def create_app():
     app = Flask(__name__)
+    # Every jsonify() response (including status polling) goes through orjson
+    app.json = OrjsonProvider(app)
     
     # CORS is required to allow your React frontend (on a different port)
     # to make requests to this Flask backend.
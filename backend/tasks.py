@@ -1,14 +1,28 @@
 # backend/tasks.py
-import os
-import concurrent.futures
+import io
+import json
+import time
+import redis
 from celery import Celery
+from celery.signals import worker_process_init
 import logging
 from core.utils import extract_script_contents
 
-# Import your existing classes from the core directory
-from core.tiktok_profile_scraper import TikTokProfileScraper
-from core.gemini_client import GeminiClient
-from core.workers import process_video_worker
+# Import your existing classes from the core directory. The scraper, Gemini
+# client and Whisper pull in heavy SDKs and torch, so they are imported inside
+# the worker code below; the Flask app importing this module stays lightweight.
+from core.workers import process_videos_pipelined, default_max_workers
+from core.cache import (
+    REDIS_URL, SCRIPT_TTL, redis_client, script_key,
+    get_cached, set_cached, acquire_lock, release_lock, wait_for_cached,
+)
+
+# Whisper model used to transcribe profile videos
+WHISPER_MODEL = "tiny"
+
+# Minimum seconds between writes of the partial script to the result backend
+# while Gemini streams; subscribers get every chunk over pub/sub regardless
+PARTIAL_STATE_INTERVAL = 1.0
 
 class NoVideosFoundError(Exception):
     """Raised when no videos are found for a given TikTok profile."""
@@ -21,7 +35,39 @@ class NoVideosFoundError(Exception):
 # Configure Celery
 # The broker is Redis, which passes messages between Flask and the Celery worker.
 # The backend is also Redis, which stores the results of your tasks.
-celery = Celery(__name__, broker='redis://localhost:6379/0', backend='redis://localhost:6379/0')
+celery = Celery(__name__, broker=REDIS_URL, backend=REDIS_URL)
+celery.conf.update(
+    result_backend=REDIS_URL,
+    task_track_started=True,
+    # Compress stored results, which carry the full generated script
+    result_compression='gzip',
+    # Keep worker processes (and the Whisper model they hold) alive across many tasks
+    worker_max_tasks_per_child=1000,
+)
+
+# Task progress is also published on a per-task pub/sub channel (over the
+# shared redis_client) so the API can push updates to clients instead of
+# having them poll the result backend.
+
+
+def task_channel(task_id: str) -> str:
+    """Return the Redis pub/sub channel carrying progress for a task."""
+    return f"task:{task_id}"
+
+
+def publish_task_event(task_id: str, event: dict) -> None:
+    """Publish a task progress event, without failing the task if Redis is unavailable."""
+    try:
+        redis_client.publish(task_channel(task_id), json.dumps(event))
+    except redis.RedisError as e:
+        logger.warning(f"Failed to publish progress for task {task_id}: {e}")
+
+
+def update_progress(task, state: str, status: str, **extra) -> None:
+    """Record a task's progress in the result backend and push it to subscribers."""
+    meta = {'status': status, **extra}
+    task.update_state(state=state, meta=meta)
+    publish_task_event(task.request.id, {'state': state, **meta})
 
 # Configure logging for this module (Celery workers will inherit this)
 logging.basicConfig(
@@ -30,15 +76,56 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+@worker_process_init.connect
+def preload_whisper_model(**kwargs):
+    """
+    Load the Whisper model once when a Celery worker process starts on a GPU
+    machine, where each task transcribes on threads sharing this process's
+    model (see core.workers._transcription_pool).
+    On CPU the transcription pool spawns its own pinned workers that each load
+    a model sized to their cores, so a copy preloaded here would only waste memory;
+    that pool persists in this process, so its workers keep their models across tasks.
+    """
+    import torch
+    if not torch.cuda.is_available():
+        return
+
+    from core.tiktok_audio_processor import TikTokAudioProcessor
+    
+    logger.info(f"Preloading Whisper model '{WHISPER_MODEL}'")
+    TikTokAudioProcessor(model_name=WHISPER_MODEL)
+
 @celery.task(bind=True)
 def generate_script_task(self, profile_name: str, topic: str, gemini_api_key: str, apify_api_key: str) -> dict:
     """
     The background task that runs the full scraping, transcription,
     and generation process. It also updates task state throughout.
+    Scripts are cached per (profile, topic); concurrent tasks for the same
+    pair wait for the one holding the lock instead of repeating the work.
     """
+    from core.tiktok_profile_scraper import TikTokProfileScraper
+    from core.gemini_client import get_gemini_client
+    
+    key = script_key(profile_name, topic)
+    locked = False
     try:
+        cached = get_cached(key)
+        if cached is None:
+            locked = acquire_lock(key)
+            if not locked:
+                logger.info(f"Waiting for in-flight script for {profile_name!r} / {topic!r}")
+                cached = wait_for_cached(key)
+        if cached is not None:
+            logger.info(f"Serving cached script for {profile_name!r} / {topic!r}")
+            publish_task_event(self.request.id, {'state': 'SUCCESS', 'result': cached})
+            return cached
+
+        # Reused across tasks in this worker, so this is normally a cache hit
+        gemini_client = get_gemini_client(gemini_api_key, "core/system_prompt.txt")
+
         # Step 1: Scrape TikTok profile
-        self.update_state(state='SCRAPING', meta={'status': 'Scraping videos from TikTok profile...'})
+        update_progress(self, 'SCRAPING', 'Scraping videos from TikTok profile...')
         scraper = TikTokProfileScraper(api_key=apify_api_key)
         urls_to_process = scraper.scrape_profile_videos(profile_name, video_limit=5)
 
@@ -47,31 +134,58 @@ def generate_script_task(self, profile_name: str, topic: str, gemini_api_key: st
             raise NoVideosFoundError(profile_name)
 
         # Step 2: Transcribe and analyze videos
-        self.update_state(state='ANALYZING', meta={'status': 'Analyzing and transcribing videos...'})
-        past_scripts_data = []
-
-        logger.info(f"Starting video processing with {os.cpu_count()} workers.")
-        with concurrent.futures.ProcessPoolExecutor() as executor:
-            future_to_url = {
-                executor.submit(process_video_worker, url, "tiny", "output", False, "en"): url
-                for url in urls_to_process
-            }
-            for future in concurrent.futures.as_completed(future_to_url):
-                result = future.result()
-                if result.get('transcription'):
-                    text = result['transcription']['text']
-                    past_scripts_data.append(f"[PAST_SCRIPT]:\n{text}")
+        update_progress(self, 'ANALYZING', 'Analyzing and transcribing videos...')
+        # Transcripts are written into the prompt as each video completes,
+        # rather than collected in a list and joined afterwards
+        prompt_buffer = io.StringIO()
+        script_count = 0
+
+        max_workers = default_max_workers(len(urls_to_process), WHISPER_MODEL)
+        logger.info(f"Starting video processing with {max_workers} workers.")
+        for url, result in process_videos_pipelined(
+            urls_to_process, WHISPER_MODEL, None, False, "en", max_workers=max_workers
+        ):
+            if result.get('transcription'):
+                script_count += 1
+                prompt_buffer.write(f"[PAST_SCRIPT_{script_count}]:\n{result['transcription']['text']}\n\n")
 
         # Step 3: Generate new script using Gemini
-        self.update_state(state='GENERATING', meta={'status': 'Generating new script...'})
-        final_scripts_string = "\n\n".join(past_scripts_data)
-        user_input = f"{final_scripts_string}\n\n[NEW_TOPIC]:\n{topic}"
+        update_progress(self, 'GENERATING', 'Generating new script...')
+        prompt_buffer.write(f"[NEW_TOPIC]:\n{topic}")
+        user_input = prompt_buffer.getvalue()
 
-        gemini_client = GeminiClient(gemini_api_key, "core/system_prompt.txt")
-        generated_script = extract_script_contents(gemini_client.generate_text(user_input))
+        # Stream the response so partial output reaches subscribers while Gemini is still generating.
+        # Each chunk is published on its own, with its offset in the script so subscribers
+        # can line it up with a 'partial' they already hold; the accumulated text is only
+        # written to the result backend (for polling clients) every PARTIAL_STATE_INTERVAL seconds.
+        generated_buffer = io.StringIO()
+        generated_length = 0
+        last_state_update = time.monotonic()
+        for chunk in gemini_client.generate_text_stream(user_input):
+            generated_buffer.write(chunk)
+            publish_task_event(self.request.id, {
+                'state': 'GENERATING', 'status': 'Generating new script...',
+                'delta': chunk, 'offset': generated_length,
+            })
+            generated_length += len(chunk)
+            now = time.monotonic()
+            if now - last_state_update >= PARTIAL_STATE_INTERVAL:
+                self.update_state(state='GENERATING', meta={
+                    'status': 'Generating new script...', 'partial': generated_buffer.getvalue(),
+                })
+                last_state_update = now
+        generated_text = generated_buffer.getvalue() or "The model returned an empty response."
+        generated_script = extract_script_contents(generated_text)
 
-        return {'status': 'Success', 'script': generated_script}
+        result = {'status': 'Success', 'script': generated_script}
+        set_cached(key, result, SCRIPT_TTL)
+        publish_task_event(self.request.id, {'state': 'SUCCESS', 'result': result})
+        return result
 
     except Exception as e:
         print(f"Task failed: {e}")
-        raise
\ No newline at end of file
+        publish_task_event(self.request.id, {'state': 'FAILURE', 'status': str(e)})
+        raise
+    finally:
+        if locked:
+            release_lock(key)
\ No newline at end of file
@@ -0,0 +1,45 @@
+# test_audio_transcriber.py
+
+"""Tests for AudioTranscriber helpers that need no loaded model."""
+
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("torch")
+pytest.importorskip("whisper")
+
+from core.audio_transcriber import AudioTranscriber
+
+
+# Speech regions as (start on the speech-only timeline, start in the original audio):
+# speech from 1.0-3.0 s and from 5.0 s onwards, with the 3.0-5.0 s silence cut out
+OFFSETS = [(0.0, 1.0), (2.0, 5.0)]
+
+
+def test_restore_timestamps_maps_segments_and_words():
+    result = {
+        "text": "one two",
+        "segments": [
+            {"start": 0.5, "end": 1.5, "words": [{"start": 0.5, "end": 1.0}, {"start": 1.0, "end": 1.5}]},
+            {"start": 2.5, "end": 3.0, "words": None},
+        ],
+    }
+
+    restored = AudioTranscriber._restore_timestamps(result, OFFSETS)
+
+    first, second = restored["segments"]
+    assert (first["start"], first["end"]) == (1.5, 2.5)
+    assert [(w["start"], w["end"]) for w in first["words"]] == [(1.5, 2.0), (2.0, 2.5)]
+    assert (second["start"], second["end"]) == (5.5, 6.0)
+
+
+def test_restore_timestamps_region_boundary_uses_later_region():
+    result = {"segments": [{"start": 2.0, "end": 2.0}]}
+
+    segment = AudioTranscriber._restore_timestamps(result, OFFSETS)["segments"][0]
+
+    assert (segment["start"], segment["end"]) == (5.0, 5.0)
+
+
+def test_restore_timestamps_without_segments():
+    assert AudioTranscriber._restore_timestamps({"text": ""}, OFFSETS) == {"text": ""}
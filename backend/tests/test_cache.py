@@ -0,0 +1,94 @@
+# test_cache.py
+
+"""Tests for the Redis and on-disk transcript caches, with Redis replaced by an in-memory fake."""
+
+import os
+
+import pytest
+
+redis = pytest.importorskip("redis")
+
+from core import cache
+
+
+class FakeRedis:
+    """Dict-backed stand-in for the few redis.Redis methods the cache uses."""
+
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def setex(self, key, ttl, value):
+        self.store[key] = value.encode("utf-8")
+
+
+class BrokenRedis:
+    """Redis client whose every call fails as if the server were down."""
+
+    def get(self, key):
+        raise redis.ConnectionError("Connection refused")
+
+    def setex(self, key, ttl, value):
+        raise redis.ConnectionError("Connection refused")
+
+
+@pytest.fixture(autouse=True)
+def transcript_dir(tmp_path, monkeypatch):
+    """Point the on-disk transcript cache at a temporary directory."""
+    directory = tmp_path / "transcripts"
+    monkeypatch.setattr(cache, "TRANSCRIPT_CACHE_DIR", str(directory))
+    return directory
+
+
+TRANSCRIPTION = {"text": "hello world", "segments": [{"start": 0.0, "end": 1.5, "text": "hello world"}]}
+
+
+def test_redis_round_trip(monkeypatch):
+    monkeypatch.setattr(cache, "redis_client", FakeRedis())
+    key = cache.transcription_key("https://www.tiktok.com/@user/video/1", "small")
+
+    assert cache.get_cached(key) is None
+    cache.set_cached(key, TRANSCRIPTION, cache.TRANSCRIPTION_TTL)
+    assert cache.get_cached(key) == TRANSCRIPTION
+
+
+def test_transcription_key_depends_on_model():
+    url = "https://www.tiktok.com/@user/video/1"
+    assert cache.transcription_key(url, "small") != cache.transcription_key(url, "medium")
+
+
+def test_redis_errors_are_misses(monkeypatch):
+    monkeypatch.setattr(cache, "redis_client", BrokenRedis())
+    key = cache.transcription_key("https://www.tiktok.com/@user/video/1", "small")
+
+    cache.set_cached(key, TRANSCRIPTION, cache.TRANSCRIPTION_TTL)
+    assert cache.get_cached(key) is None
+
+
+def test_disk_round_trip():
+    url = "https://www.tiktok.com/@user/video/1"
+
+    assert cache.load_transcript(url, "small") is None
+    cache.store_transcript(url, "small", TRANSCRIPTION)
+    assert cache.load_transcript(url, "small") == TRANSCRIPTION
+    assert cache.load_transcript(url, "medium") is None
+
+
+def test_corrupt_disk_entry_is_a_miss(transcript_dir):
+    url = "https://www.tiktok.com/@user/video/1"
+    transcript_dir.mkdir()
+    with open(cache.transcript_cache_path(url, "small"), "w", encoding="utf-8") as f:
+        f.write("{not json")
+
+    assert cache.load_transcript(url, "small") is None
+
+
+def test_unserializable_transcript_leaves_no_file(transcript_dir):
+    url = "https://www.tiktok.com/@user/video/1"
+
+    cache.store_transcript(url, "small", {"text": object()})
+
+    assert cache.load_transcript(url, "small") is None
+    assert os.listdir(transcript_dir) == []
@@ -0,0 +1,126 @@
+# test_tiktok_profile_scraper.py
+
+"""Tests for TikTokProfileScraper, with the Apify client replaced by an in-memory fake."""
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("apify_client")
+
+from core import tiktok_profile_scraper
+from core.tiktok_profile_scraper import TikTokProfileScraper
+from core.tiktok_downloader import TikTokTranscriberError
+
+
+class FakeDataset:
+    """Dataset client serving a fixed list of items and recording each page request."""
+
+    def __init__(self, items):
+        self.items = items
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def list_items(self, offset, limit, fields, clean):
+        with self._lock:
+            self.calls.append((offset, limit))
+        return SimpleNamespace(items=self.items[offset:offset + limit])
+
+
+class FakeApifyClient:
+    """ApifyClient stand-in that never touches the network."""
+
+    datasets = {}
+
+    def __init__(self, api_key):
+        self.api_key = api_key
+
+    def actor(self, actor_id):
+        return SimpleNamespace(id=actor_id)
+
+    def dataset(self, dataset_id):
+        return self.datasets[dataset_id]
+
+
+@pytest.fixture
+def scraper(monkeypatch):
+    monkeypatch.setattr(tiktok_profile_scraper, "ApifyClient", FakeApifyClient)
+    monkeypatch.setattr(FakeApifyClient, "datasets", {})
+    # Small pages keep the multi-page cases short
+    monkeypatch.setattr(tiktok_profile_scraper, "_DATASET_PAGE_SIZE", 3)
+    return TikTokProfileScraper(api_key="token")
+
+
+def _dataset(items):
+    dataset = FakeDataset(items)
+    FakeApifyClient.datasets["dataset"] = dataset
+    return dataset
+
+
+def _videos(count):
+    return [{"webVideoUrl": f"https://www.tiktok.com/@user/video/{i}"} for i in range(count)]
+
+
+@pytest.mark.parametrize("profile_url, username", [
+    ("https://www.tiktok.com/@some.user_1", "some.user_1"),
+    ("https://www.tiktok.com/@some.user_1/video/7412345678901234567", "some.user_1"),
+    ("https://tiktok.com/@user?lang=en", "user"),
+    ("https://vm.example.com/@user/", "user"),
+])
+def test_extract_username(scraper, profile_url, username):
+    assert scraper._extract_username(profile_url) == username
+
+
+@pytest.mark.parametrize("profile_url", [
+    "https://www.tiktok.com/",
+    "https://www.tiktok.com/discover/cooking",
+])
+def test_extract_username_rejects_non_profile_urls(scraper, profile_url):
+    with pytest.raises(TikTokTranscriberError):
+        scraper._extract_username(profile_url)
+
+
+def test_fetch_within_one_page(scraper):
+    dataset = _dataset(_videos(10))
+
+    urls = scraper._fetch_video_urls("dataset", 2)
+
+    assert urls == [item["webVideoUrl"] for item in _videos(2)]
+    assert dataset.calls == [(0, 2)]
+
+
+def test_fetch_spanning_pages_keeps_dataset_order(scraper):
+    dataset = _dataset(_videos(10))
+
+    urls = scraper._fetch_video_urls("dataset", 7)
+
+    assert urls == [item["webVideoUrl"] for item in _videos(7)]
+    assert sorted(dataset.calls) == [(0, 3), (3, 3), (6, 1)]
+
+
+def test_fetch_tops_up_items_without_url(scraper):
+    items = _videos(5)
+    items[1] = {"webVideoUrl": None}
+    dataset = _dataset(items)
+
+    urls = scraper._fetch_video_urls("dataset", 3)
+
+    assert urls == [items[0]["webVideoUrl"], items[2]["webVideoUrl"], items[3]["webVideoUrl"]]
+    assert dataset.calls == [(0, 3), (3, 1)]
+
+
+def test_fetch_stops_when_dataset_runs_out(scraper):
+    dataset = _dataset(_videos(4))
+
+    urls = scraper._fetch_video_urls("dataset", 7)
+
+    assert urls == [item["webVideoUrl"] for item in _videos(4)]
+    # The short second page marks the dataset exhausted, so there is no top-up
+    assert sorted(dataset.calls) == [(0, 3), (3, 3), (6, 1)]
+
+
+def test_fetch_empty_dataset(scraper):
+    _dataset([])
+
+    assert scraper._fetch_video_urls("dataset", 2) == []
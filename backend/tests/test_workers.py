@@ -0,0 +1,64 @@
+# test_workers.py
+
+"""Tests for the transcription pool sizing helpers, with the CPU and memory probes stubbed."""
+
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("redis")
+
+from core import workers
+
+
+@pytest.fixture
+def eight_cpus(monkeypatch):
+    monkeypatch.setattr(workers.os, "cpu_count", lambda: 8)
+    monkeypatch.setattr(workers.os, "sched_getaffinity", lambda pid: set(range(8)), raising=False)
+
+
+@pytest.fixture
+def no_psutil(monkeypatch):
+    # A None entry makes "import psutil" raise ImportError
+    monkeypatch.setitem(sys.modules, "psutil", None)
+
+
+def _fake_psutil(monkeypatch, available_gb):
+    memory = SimpleNamespace(available=available_gb * 1024 ** 3)
+    monkeypatch.setitem(sys.modules, "psutil", SimpleNamespace(virtual_memory=lambda: memory))
+
+
+@pytest.mark.parametrize("num_urls, model_name, expected", [
+    (3, "tiny", 3),
+    (100, "tiny", 8),
+    (100, "small", 4),
+    (100, "medium", 2),
+    (100, "large-v3", 1),
+])
+def test_default_max_workers_without_psutil(eight_cpus, no_psutil, num_urls, model_name, expected):
+    assert workers.default_max_workers(num_urls, model_name) == expected
+
+
+def test_default_max_workers_capped_by_memory(eight_cpus, monkeypatch):
+    _fake_psutil(monkeypatch, available_gb=5)
+
+    # "small" takes about 2 GB per worker, so only two fit
+    assert workers.default_max_workers(100, "small") == 2
+
+
+def test_default_max_workers_is_at_least_one(eight_cpus, monkeypatch):
+    _fake_psutil(monkeypatch, available_gb=0)
+
+    assert workers.default_max_workers(100, "tiny") == 1
+    assert workers.default_max_workers(0, "tiny") == 1
+
+
+def test_core_groups_are_disjoint_and_equal(eight_cpus):
+    assert workers._core_groups(4) == [[0, 1], [2, 3], [4, 5], [6, 7]]
+    assert workers._core_groups(3) == [[0, 1], [2, 3], [4, 5]]
+
+
+def test_core_groups_capped_by_cores(eight_cpus):
+    assert workers._core_groups(20) == [[core] for core in range(8)]
+    assert workers._core_groups(0) == [list(range(8))]
@@ -102,106 +102,102 @@ const App = () => {
 
 
 
-  // Poll status endpoint
+  // Apply a status payload from the backend; returns true once the task has finished
+  const applyStatus = useCallback((data) => {
+    if (data.state === 'SUCCESS') {
+      setCurrentState('SUCCESS');
+      setStatus('Script generated successfully!');
+      setScript(data.result.script);
+      setIsLoading(false);
+      return true;
+    } else if (data.state === 'FAILURE' || data.state === 'REVOKED') {
+      setStatus('An unexpected error was encountered.')
+      setError(data.status || 'Script generation failed');
+      setIsLoading(false);
+      setCurrentState('');
+      return true;
+    }
+    // Update current state and status for progress tracking
+    setCurrentState(data.state);
+    setStatus(data.status);
+    // Show the script as it streams in: polling and the first streamed event carry
+    // the text so far, later streamed events only the chunk at its offset
+    if (typeof data.partial === 'string') {
+      setScript((prev) => (data.partial.length >= prev.length ? data.partial : prev));
+    } else if (typeof data.delta === 'string') {
+      setScript((prev) => {
+        if (data.offset > prev.length || data.offset + data.delta.length <= prev.length) {
+          return prev; // A gap (filled by the next partial) or text we already have
+        }
+        return prev.slice(0, data.offset) + data.delta;
+      });
+    }
+    return false;
+  }, []);
 
+  // Poll status endpoint (fallback when the event stream is unavailable)
   const pollStatus = useCallback(async (id) => {
-
     let retryCount = 0;
-
     const maxRetries = 3;
-   
 
     const poll = async () => {
-
       try {
-
         const response = await fetch(`${url}/api/status/${id}`);
-2
-       
 
         if (!response.ok) {
-
           throw new Error('Status check failed');
-
         }
 
-       
-
         const data = await response.json();
-
-
-
-        if (data.state === 'SUCCESS') {
-
-          setCurrentState('SUCCESS');
-
-          setStatus('Script generated successfully!');
-
-          setScript(data.result.script);
-
-          setIsLoading(false);
-
-          return; // Stop polling
-
-        } else if (data.state === 'FAILURE') {
-
-          setStatus('An unexpected error was encountered.')
-
-          setError(data.status || 'Script generation failed');
-
-          setIsLoading(false);
-
-          setCurrentState('');
-
+        if (applyStatus(data)) {
           return; // Stop polling
-
-        } else {
-
-          // Update current state and status for progress tracking
-
-          setCurrentState(data.state);
-
-          setStatus(data.status)
-
         }
 
-       
-
         // Continue polling after 2 seconds
-
         setTimeout(poll, 2000);
-
         retryCount = 0; // Reset retry count on successful request
 
-       
-
       } catch (err) {
-
         retryCount++;
-
         if (retryCount <= maxRetries) {
-
           setTimeout(poll, 3000); // Retry after 3 seconds
-
         } else {
-
           setError('Lost connection while fetching status. Please wait and try again.');
-
           setIsLoading(false);
-
           setCurrentState('');
-
         }
-
       }
-
     };
 
-   
-
     poll();
+  }, [applyStatus]);
 
-  }, []);
+  // Subscribe to pushed status updates, falling back to polling if the stream fails
+  const watchStatus = useCallback((id) => {
+    if (typeof EventSource === 'undefined') {
+      pollStatus(id);
+      return;
+    }
+
+    const source = new EventSource(`${url}/api/status/${id}/stream`);
+    let finished = false;
+
+    source.onmessage = (event) => {
+      if (applyStatus(JSON.parse(event.data))) {
+        finished = true;
+        source.close();
+      }
+    };
+
+    source.onerror = () => {
+      // EventSource would reconnect on its own; poll instead so a proxy that
+      // drops the stream cannot leave the page waiting
+      source.close();
+      if (!finished) {
+        pollStatus(id);
+      }
+    };
+  }, [applyStatus, pollStatus]);
 
 
 
@@ -266,7 +262,7 @@ const App = () => {
 
       const data = await response.json();
       setTaskId(data.task_id);
-      pollStatus(data.task_id);
+      watchStatus(data.task_id);
 
 
 